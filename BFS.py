@@ -9,12 +9,31 @@
 
 import collections
 import math
+from array import array
+from itertools import chain
+
+from csr import CSRGraph, LabelView
 
 class GraphAdjList:
     def __init__(self, vertices, directed=False):
         self.vertices = set(vertices)
         self.adj = {v: [] for v in vertices}
         self.directed = directed
+        self._reverse = None  # Cache das listas de entrada (ver reverse_adj)
+
+    @classmethod
+    def from_edge_array(cls, sources, targets, vertices=None, directed=False):
+        """
+        Cria o grafo a partir de dois arrays (ou listas) de pontas. Sem vertices, os vértices
+        são os rótulos que aparecem nas arestas, na ordem da primeira aparição.
+        """
+        sources = sources.tolist() if hasattr(sources, 'tolist') else list(sources)
+        targets = targets.tolist() if hasattr(targets, 'tolist') else list(targets)
+        if vertices is None:
+            vertices = dict.fromkeys(chain.from_iterable(zip(sources, targets)))
+        graph = cls(vertices, directed)
+        graph.add_edges(zip(sources, targets))
+        return graph
 
     def add_edge(self, u, v):
         if u not in self.vertices or v not in self.vertices:
@@ -22,13 +41,66 @@ class GraphAdjList:
         self.adj[u].append(v)
         if not self.directed:
             self.adj[v].append(u)
+        self._reverse = None
+
+    def add_edges(self, edges):
+        """
+        Adiciona um lote de arestas (u, v), com o mesmo resultado de add_edge para cada uma.
+        Todos os vértices são validados antes, com uma única operação de conjunto; se algum
+        não pertencer ao grafo, nada é adicionado.
+        """
+        edges = edges.tolist() if hasattr(edges, 'tolist') else list(edges)
+        if not self.vertices.issuperset(chain.from_iterable(edges)):
+            raise ValueError("Vértices devem pertencer ao grafo.")
+        adj = self.adj
+        if self.directed:
+            for u, v in edges:
+                adj[u].append(v)
+        else:
+            for u, v in edges:
+                adj[u].append(v)
+                adj[v].append(u)
+        self._reverse = None
 
     def get_neighbors(self, u):
         return self.adj.get(u, [])
 
+    def reverse_adj(self):
+        """
+        Listas de entrada {vértice: [predecessores]}, construídas uma vez em O(V + E) e
+        guardadas até a próxima add_edge/add_edges (alterações feitas direto em adj exigem
+        graph._reverse = None). Num grafo não direcionado são as próprias listas de adj.
+        """
+        if not self.directed:
+            return self.adj
+        if self._reverse is None:
+            reverse = {v: [] for v in self.adj}
+            for u, neighbors in self.adj.items():
+                for v in neighbors:
+                    reverse[v].append(u)
+            self._reverse = reverse
+        return self._reverse
+
 
 # Algoritmo BFS (CLRS)
-def bfs(graph, start_node):
+def bfs(graph, start_node, compact=False, direction_optimizing=False):
+    """
+    Com compact=True a busca roda sobre um CSRGraph (outras representações são convertidas)
+    usando apenas vetores array('i') de distância e predecessor indexados por id, e retorna
+    LabelViews: visões {rótulo: valor} preguiçosas cujos arrays ficam em .data.
+
+    Com direction_optimizing=True usa a BFS que alterna entre top-down e bottom-up
+    (ver bfs_arrays); as distâncias são as mesmas e reconstruct_path continua válido.
+    """
+    if compact or direction_optimizing or isinstance(graph, CSRGraph):
+        csr = CSRGraph.from_graph(graph)
+        dist, pred = bfs_arrays(csr, start_node, direction_optimizing)
+        distance = LabelView(csr, dist, missing=-1, default=math.inf)
+        predecessor = LabelView(csr, pred, missing=-1, default=None, as_label=True)
+        if compact:
+            return distance, predecessor
+        return distance.to_dict(), predecessor.to_dict()
+
     if start_node not in graph.vertices:
         raise ValueError("O vértice inicial não pertence ao grafo.")
 
@@ -53,6 +125,147 @@ def bfs(graph, start_node):
     return distance, predecessor
 
 
+# BFS em fluxo: eventos de descoberta gerados durante a busca
+def bfs_events(graph, start_node, max_depth=None):
+    """
+    Gera (vértice, profundidade, predecessor) para cada vértice no momento em que é
+    descoberto, na mesma ordem da bfs; o vértice inicial vem primeiro, com predecessor None.
+    Quem consome pode parar a qualquer momento, e max_depth limita os níveis explorados.
+
+    Nenhum dicionário por vértice é criado: a busca anda nível a nível e guarda só as
+    fronteiras e os visitados (um bytearray por id para CSRGraph, um set para GraphAdjList).
+    """
+    if start_node not in graph.vertices:
+        raise ValueError("O vértice inicial não pertence ao grafo.")
+    if isinstance(graph, CSRGraph):
+        return _bfs_events_csr(graph, graph.id_of(start_node), max_depth)
+    return _bfs_events_labels(graph, start_node, max_depth)
+
+
+def _bfs_events_csr(graph, s, max_depth):
+    offsets, targets, label = graph.offsets, graph.targets, graph.label_of
+    seen = bytearray(graph.num_vertices)
+    seen[s] = 1
+    yield label(s), 0, None
+    frontier, depth = [s], 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            parent = label(u)
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not seen[v]:
+                    seen[v] = 1
+                    next_frontier.append(v)
+                    yield label(v), depth, parent
+        frontier = next_frontier
+
+
+def _bfs_events_labels(graph, s, max_depth):
+    seen = {s}
+    yield s, 0, None
+    frontier, depth = [s], 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            for v in graph.get_neighbors(u):
+                if v not in seen:
+                    seen.add(v)
+                    next_frontier.append(v)
+                    yield v, depth, u
+        frontier = next_frontier
+
+
+# BFS sobre CSRGraph com vetores compactos indexados por id
+def bfs_arrays(graph, start_node, direction_optimizing=False, alpha=14, beta=24):
+    """
+    Retorna (distance, predecessor) como array('i') indexados pelos ids do CSRGraph, com -1
+    para vértices inalcançáveis / sem predecessor. A distância -1 faz o papel da cor WHITE,
+    então nenhum vetor de cores separado é necessário (4 + 4 bytes por vértice).
+
+    A busca é feita nível a nível. Com direction_optimizing=True (Beamer et al.), quando as
+    arestas que saem da fronteira passam de 1/alpha das arestas ainda não exploradas, o
+    passo vira bottom-up: cada vértice não visitado procura um pai na fronteira pelos seus
+    vizinhos de entrada e para no primeiro encontrado. Volta para top-down quando a
+    fronteira cai abaixo de n/beta vértices. As distâncias são idênticas às da BFS comum;
+    os predecessores dos níveis bottom-up podem ser outro pai válido no nível anterior.
+    """
+    if start_node not in graph:
+        raise ValueError("O vértice inicial não pertence ao grafo.")
+
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    dist = array('i', [-1]) * n
+    pred = array('i', [-1]) * n
+
+    s = graph.id_of(start_node)
+    dist[s] = 0
+
+    if not direction_optimizing:
+        queue = collections.deque([s])
+        while queue:
+            u = queue.popleft()
+            du = dist[u] + 1
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if dist[v] < 0:
+                    dist[v] = du
+                    pred[v] = u
+                    queue.append(v)
+        return dist, pred
+
+    # Vizinhos de entrada para o passo bottom-up (o próprio grafo se não direcionado)
+    reverse = graph.transpose()
+    in_offsets, in_targets = reverse.offsets, reverse.targets
+
+    frontier = [s]
+    unexplored_edges = len(targets) - (offsets[s + 1] - offsets[s])
+    remaining = None  # Vértices ainda não visitados, compactada a cada passo bottom-up
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        level += 1
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            if remaining is None:
+                remaining = [v for v in range(n) if dist[v] < 0]
+            still = []
+            for v in remaining:
+                if dist[v] >= 0:
+                    continue
+                for u in in_targets[in_offsets[v]:in_offsets[v + 1]]:
+                    if in_frontier[u]:
+                        dist[v] = level
+                        pred[v] = u
+                        next_frontier.append(v)
+                        break
+                else:
+                    still.append(v)
+            remaining = still
+        else:
+            for u in frontier:
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    if dist[v] < 0:
+                        dist[v] = level
+                        pred[v] = u
+                        next_frontier.append(v)
+
+        unexplored_edges -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+
+    return dist, pred
+
+
 # Reconstrução do Caminho
 def reconstruct_path(predecessor, start_node, end_node):
     if predecessor.get(end_node) is None and start_node != end_node:
@@ -65,6 +278,151 @@ def reconstruct_path(predecessor, start_node, end_node):
     return path[::-1]
 
 
+# BFS de várias fontes com fronteiras bit-paralelas
+def multi_source_bfs(graph, sources, batch_size=64):
+    """
+    Calcula as distâncias (em arestas) de cada vértice de `sources` para todos os vértices do
+    grafo e retorna a matriz de distâncias: uma linha array('i') por fonte, na ordem de
+    `sources`, com -1 para vértices inalcançáveis.
+
+    Aceita GraphAdjList ou CSRGraph (outras representações são convertidas uma única vez com
+    CSRGraph.from_graph). As linhas são indexadas pelos ids do CSRGraph: num GraphAdjList o
+    id de um vértice é a sua posição em graph.adj, e CSRGraph.from_graph(graph).id_of e
+    label_of fazem a conversão.
+
+    As fontes são processadas em lotes de batch_size: em cada lote o estado "já visto" e a
+    fronteira de cada vértice são máscaras de bits (um bit por fonte, em inteiros Python de
+    largura arbitrária), de modo que cada lista de adjacência é percorrida uma única vez
+    por nível para todas as fontes do lote.
+    """
+    graph = CSRGraph.from_graph(graph)
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    ids = []
+    for source in sources:
+        if source not in graph:
+            raise ValueError("O vértice inicial não pertence ao grafo.")
+        ids.append(graph.id_of(source))
+
+    matrix = []
+    for first in range(0, len(ids), batch_size):
+        batch = ids[first:first + batch_size]
+        rows = [array('i', [-1]) * n for _ in batch]
+        seen = [0] * n   # Bit i ligado: vértice já alcançado pela i-ésima fonte do lote
+        visit = {}       # Fronteira esparsa: vértice -> fontes que o alcançaram neste nível
+        for i, s in enumerate(batch):
+            seen[s] |= 1 << i
+            visit[s] = visit.get(s, 0) | (1 << i)
+            rows[i][s] = 0
+
+        level = 0
+        while visit:
+            level += 1
+            visit_next = {}
+            for v, mask in visit.items():
+                for w in targets[offsets[v]:offsets[v + 1]]:
+                    new = mask & ~seen[w]
+                    if new:
+                        seen[w] |= new
+                        visit_next[w] = visit_next.get(w, 0) | new
+
+            # Registra a distância de cada fonte que chegou a w neste nível
+            for w, new in visit_next.items():
+                while new:
+                    low = new & -new
+                    rows[low.bit_length() - 1][w] = level
+                    new ^= low
+            visit = visit_next
+
+        matrix.extend(rows)
+
+    return matrix
+
+
+# Caminho mínimo entre dois vértices com BFS bidirecional
+def shortest_path(graph, start_node, end_node):
+    """
+    Retorna (comprimento, caminho) entre start_node e end_node, ou (math.inf, None) se não
+    houver caminho. Duas BFS avançam ao mesmo tempo, uma a partir de cada ponta, sempre
+    expandindo um nível inteiro da fronteira menor, e param no primeiro nível em que as
+    buscas se encontram. Apenas os vértices tocados são guardados (dicionários esparsos),
+    então a consulta visita cerca de O(b^(d/2)) vértices em vez do grafo inteiro.
+
+    Aceita GraphAdjList ou CSRGraph. Em grafos direcionados a busca reversa usa os vizinhos
+    de entrada, construídos uma vez e reaproveitados nas consultas seguintes: o transposto do
+    CSRGraph ou as listas de GraphAdjList.reverse_adj.
+    """
+    if start_node not in graph.vertices or end_node not in graph.vertices:
+        raise ValueError("Os vértices devem pertencer ao grafo.")
+    if start_node == end_node:
+        return 0, [start_node]
+
+    if isinstance(graph, CSRGraph):
+        csr = graph
+        offsets, targets = csr.offsets, csr.targets
+        reverse = csr.transpose()
+        in_offsets, in_targets = reverse.offsets, reverse.targets
+
+        def forward(u):
+            return targets[offsets[u]:offsets[u + 1]]
+
+        def backward(v):
+            return in_targets[in_offsets[v]:in_offsets[v + 1]]
+
+        length, path = _bidirectional(csr.id_of(start_node), csr.id_of(end_node), forward, backward)
+        return length, ([csr.label_of(v) for v in path] if path is not None else None)
+
+    reverse = graph.reverse_adj()
+    return _bidirectional(start_node, end_node, graph.get_neighbors, reverse.__getitem__)
+
+
+def _bidirectional(s, t, forward, backward):
+    parent_f = {s: None}  # Predecessores da busca a partir de s
+    parent_b = {t: None}  # Sucessores da busca a partir de t
+    dist_f, dist_b = {s: 0}, {t: 0}
+    frontier_f, frontier_b = [s], [t]
+
+    while frontier_f and frontier_b:
+        # Expande o lado com a menor fronteira
+        if len(frontier_f) <= len(frontier_b):
+            frontier, neighbors, parent, dist, other = frontier_f, forward, parent_f, dist_f, dist_b
+        else:
+            frontier, neighbors, parent, dist, other = frontier_b, backward, parent_b, dist_b, dist_f
+
+        next_frontier = []
+        best, meet = math.inf, None
+        for u in frontier:
+            du = dist[u] + 1
+            for v in neighbors(u):
+                if v not in dist:
+                    dist[v] = du
+                    parent[v] = u
+                    next_frontier.append(v)
+                    # Encontro: completa o nível e fica com a menor soma
+                    if v in other and du + other[v] < best:
+                        best, meet = du + other[v], v
+
+        if meet is not None:
+            path = []
+            v = meet
+            while v is not None:
+                path.append(v)
+                v = parent_f[v]
+            path.reverse()
+            v = parent_b[meet]
+            while v is not None:
+                path.append(v)
+                v = parent_b[v]
+            return best, path
+
+        if frontier is frontier_f:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+
+    return math.inf, None
+
+
 # Programa principal
 if __name__ == "__main__":
     # Definir os vértices e arestas do grafo
@@ -78,6 +436,7 @@ if __name__ == "__main__":
         g.add_edge(u, v)
 
     print("Grafo criado com os vértices:", sorted(g.vertices))
+    print("Dois primeiros níveis a partir de A:", list(bfs_events(g, "A", max_depth=2)))
 
     try:
         start_vertex = input("Digite o vértice inicial: ").strip().upper()
@@ -86,14 +445,12 @@ if __name__ == "__main__":
         if start_vertex not in g.vertices or end_vertex not in g.vertices:
             print("Erro: Um ou ambos os vértices não existem no grafo.")
         else:
-            distances, predecessors = bfs(g, start_vertex)
-            path_length = distances[end_vertex]
+            path_length, path = shortest_path(g, start_vertex, end_vertex)
 
             if path_length == math.inf:
                 print(f"Não existe caminho entre {start_vertex} e {end_vertex}.")
             else:
                 print(f"O comprimento do caminho mais curto de {start_vertex} a {end_vertex} é: {path_length}")
-                path = reconstruct_path(predecessors, start_vertex, end_vertex)
                 if path:
                     print("O caminho é:", " -> ".join(path))
 
@@ -5,45 +5,157 @@
     implementadas no trabalho anterior, implemente o Alg. DFS de Cormen et. al. Obs.: O grafo deve ser
     pré-informado.
 """
+
+from array import array
+
+from csr import CSRGraph, LabelView
+
+BRANCO, CINZA, PRETO = 0, 1, 2  # Cores dos vértices, indexadas por id
+
+
 class DFS_Runner_List:
 
     def __init__(self, graph):
-        self.graph = graph
-        self.vertices = list(graph.keys())
+        self.graph = graph  # dict {vértice: [vizinhos]} ou CSRGraph
+        self._index = None  # Índice de ordem determinística, construído uma única vez
 
         # Estruturas para o estado dos vértices
-        self.color = {}   # Cor de cada vértice (BRANCO, CINZA, PRETO)
+        self.color = bytearray()  # Cor de cada vértice por id do índice (BRANCO, CINZA, PRETO)
         self.pi = {}      # Predecessores
         self.d = {}       # Tempo de descoberta
         self.f = {}       # Tempo de finalização
         self.time = 0     # Contador global de tempo
 
+    def _ordered(self):
+        # Vértices e vizinhos já ordenados: nenhuma execução precisa chamar sorted()
+        if self._index is None:
+            self._index = CSRGraph.from_graph(self.graph).ordered()
+        return self._index
+
+    @property
+    def vertices(self):
+        """Rótulos dos vértices na ordem do grafo (lista montada só quando pedida)."""
+        return list(self.graph.keys())
+
+    def refresh_index(self):
+        """Descarta o índice de ordenação; chame após alterar o grafo."""
+        self._index = None
+
     def _initialize(self):
-        for vertex in self.vertices:
-            self.color[vertex] = 'BRANCO'
-            self.pi[vertex] = None
+        # Vetores compactos por id: 1 byte de cor e 3 × 4 bytes de tempos/predecessor
+        n = self._ordered().num_vertices
+        self.color = bytearray(n)  # BRANCO == 0
+        self._pi = array('i', [-1]) * n
+        self._d = array('i', bytes(4 * n))
+        self._f = array('i', bytes(4 * n))
         self.time = 0
 
-    def run_dfs(self):
+    def run_dfs(self, compact=False):
+        """
+        Executa a DFS. Com compact=True os resultados não são convertidos em dicionários:
+        cada entrada é uma LabelView preguiçosa sobre o array('i') indexado pelos ids de
+        self.index (disponível em .data), com predecessor -1 para as raízes.
+        """
         self._initialize()
-        for u in sorted(self.vertices):  # Ordem determinística
-            if self.color[u] == 'BRANCO':
+        color = self.color
+        for u in range(self._index.num_vertices):  # Ids já estão em ordem determinística
+            if color[u] == BRANCO:
                 self._dfs_visit(u)
+
+        index = self._index
+        self.d = LabelView(index, self._d, missing=0)
+        self.f = LabelView(index, self._f, missing=0)
+        self.pi = LabelView(index, self._pi, missing=-1, as_label=True)
+        if not compact:
+            self.d, self.f, self.pi = self.d.to_dict(), self.f.to_dict(), self.pi.to_dict()
         return self.get_results()
 
+    @property
+    def index(self):
+        """Índice ordenado (CSRGraph) cujos ids indexam os arrays do modo compacto."""
+        return self._ordered()
+
     def _dfs_visit(self, u):
-        self.time += 1
-        self.d[u] = self.time
-        self.color[u] = 'CINZA'
+        # DFS-VISIT com pilha explícita: para cada vértice da pilha guarda-se a posição
+        # do próximo vizinho a examinar em targets, reproduzindo a ordem da versão recursiva
+        index = self._index
+        offsets, targets = index.offsets, index.targets
+        color, pi, d, f = self.color, self._pi, self._d, self._f
+        time = self.time + 1
+        d[u] = time
+        color[u] = CINZA
+        stack = [u]
+        cursor = [offsets[u]]
+
+        while stack:
+            x = stack[-1]
+            k, end = cursor[-1], offsets[x + 1]
+            while k < end:  # Retoma a iteração sobre os vizinhos de x
+                v = targets[k]
+                k += 1
+                if color[v] == BRANCO:
+                    break
+            else:
+                stack.pop()
+                cursor.pop()
+                color[x] = PRETO
+                time += 1
+                f[x] = time
+                continue
 
-        for v in sorted(self.graph.get(u, [])):  # Itera sobre vizinhos
-            if self.color[v] == 'BRANCO':
-                self.pi[v] = u
-                self._dfs_visit(v)
+            cursor[-1] = k
+            pi[v] = x
+            time += 1
+            d[v] = time
+            color[v] = CINZA
+            stack.append(v)
+            cursor.append(offsets[v])
 
-        self.color[u] = 'PRETO'
-        self.time += 1
-        self.f[u] = self.time
+        self.time = time
+
+    def iter_dfs(self, source=None):
+        """
+        Versão em fluxo da DFS: gera (evento, vértice, tempo, predecessor) à medida que a
+        busca anda, com evento 'descoberta' ou 'finalizacao' e os mesmos tempos d/f de
+        run_dfs (predecessor None nas raízes). Com source, percorre só a árvore a partir
+        desse vértice. Só a pilha e um byte de cor por vértice ficam em memória; os
+        resultados de run_dfs (d, f, pi) não são alterados.
+        """
+        index = self._ordered()
+        offsets, targets, label = index.offsets, index.targets, index.label_of
+        color = bytearray(index.num_vertices)
+        roots = range(index.num_vertices) if source is None else (index.id_of(source),)
+        time = 0
+        for r in roots:
+            if color[r] != BRANCO:
+                continue
+            time += 1
+            color[r] = CINZA
+            yield 'descoberta', label(r), time, None
+            stack = [r]
+            cursor = [offsets[r]]
+            while stack:
+                x = stack[-1]
+                k, end = cursor[-1], offsets[x + 1]
+                while k < end:
+                    v = targets[k]
+                    k += 1
+                    if color[v] == BRANCO:
+                        break
+                else:
+                    stack.pop()
+                    cursor.pop()
+                    color[x] = PRETO
+                    time += 1
+                    yield 'finalizacao', label(x), time, label(stack[-1]) if stack else None
+                    continue
+
+                cursor[-1] = k
+                time += 1
+                color[v] = CINZA
+                yield 'descoberta', label(v), time, label(x)
+                stack.append(v)
+                cursor.append(offsets[v])
 
     def get_results(self):
         return {
@@ -77,3 +189,7 @@ if __name__ == "__main__":
     print("\nPredecessores (π):")
     print(resultados["predecessores"])
 
+    print("\nEventos da árvore de A, em fluxo:")
+    for evento, vertice, tempo, pai in dfs.iter_dfs('A'):
+        print(f"  {tempo:2}: {evento} de {vertice} (predecessor {pai})")
+
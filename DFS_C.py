@@ -6,24 +6,49 @@
     implementado e testado.
 """
 
-from collections import defaultdict
+from array import array
+
+from csr import CSRGraph
+from cycles import simple_cycles
+
+BRANCO, CINZA, PRETO = 0, 1, 2  # Cores dos vértices, indexadas por id
+
 
 class DFS_Cycle_Finder:
     """
     Implementa o algoritmo DFS modificado para encontrar o primeiro ciclo
     em um grafo direcionado, parar a execução e retornar o ciclo.
+
+    O grafo pode ser um dicionário {vértice: [vizinhos]} ou um CSRGraph.
+    A ordem determinística (vértices e vizinhos ordenados) vem de um índice
+    construído uma única vez e reaproveitado em todas as execuções.
     """
     def __init__(self, graph):
         self.graph = graph
-        self.vertices = list(graph.keys())
-        self.color = {}  # Estado de cada vértice: BRANCO, CINZA, PRETO
-        self.pi = {}     # Dicionário de predecessores para reconstruir o ciclo
+        self._index = None  # Índice de ordem determinística (CSRGraph ordenado)
+        self.color = bytearray()  # Estado de cada vértice por id: BRANCO, CINZA, PRETO
+        self.pi = array('i')      # Predecessores por id para reconstruir o ciclo
+
+    def _ordered(self):
+        """Retorna o índice de ordenação, construindo-o na primeira execução."""
+        if self._index is None:
+            self._index = CSRGraph.from_graph(self.graph).ordered()
+        return self._index
+
+    @property
+    def vertices(self):
+        """Rótulos dos vértices na ordem do grafo (lista montada só quando pedida)."""
+        return list(self.graph.keys())
+
+    def refresh_index(self):
+        """Descarta o índice de ordenação; chame após alterar o grafo."""
+        self._index = None
 
     def _initialize(self):
         """Inicializa as estruturas de dados para cada execução."""
-        for vertex in self.vertices:
-            self.color[vertex] = 'BRANCO'
-            self.pi[vertex] = None
+        n = self._ordered().num_vertices
+        self.color = bytearray(n)  # BRANCO == 0
+        self.pi = array('i', [-1]) * n
 
     def find_first_cycle(self):
         """
@@ -32,9 +57,10 @@ class DFS_Cycle_Finder:
         ou None se o grafo for acíclico.
         """
         self._initialize()
+        color = self.color
         # Itera sobre todos os vértices para lidar com grafos desconexos
-        for u in sorted(self.vertices):  # Ordem determinística
-            if self.color[u] == 'BRANCO':
+        for u in range(self._index.num_vertices):  # Ids já em ordem determinística
+            if color[u] == BRANCO:
                 # Inicia uma nova árvore DFS
                 cycle = self._dfs_visit_cycle(u)
                 if cycle:
@@ -42,29 +68,57 @@ class DFS_Cycle_Finder:
                     return cycle
         return None  # Nenhum ciclo encontrado em todo o grafo
 
+    def iter_cycles(self, max_length=None):
+        """
+        Gera todos os ciclos elementares (não só o primeiro), um por vez, com o algoritmo
+        de Johnson sobre o mesmo índice ordenado (ver cycles.simple_cycles).
+        """
+        return simple_cycles(self._ordered(), max_length)
+
     def _dfs_visit_cycle(self, u):
         """
-        Função recursiva da DFS que detecta e reconstrói o ciclo.
+        DFS iterativa (pilha explícita, sem recursão) que detecta e reconstrói o ciclo.
+        Para cada vértice da pilha guarda-se a posição do próximo vizinho a examinar,
+        de modo que a ordem de visita é a mesma da versão recursiva.
         """
-        self.color[u] = 'CINZA'  # Nó sendo visitado (na pilha de recursão)
-
-        for v in sorted(self.graph.get(u, [])):  # Vizinhos de u
-            if self.color[v] == 'CINZA':
-                # Aresta de retorno detectada: ciclo!
-                reconstructed_cycle = [v]
-                current = u
-                while current != v:
-                    reconstructed_cycle.insert(1, current)
-                    current = self.pi[current]
-                return reconstructed_cycle
-
-            if self.color[v] == 'BRANCO':
-                self.pi[v] = u
-                cycle_found = self._dfs_visit_cycle(v)
-                if cycle_found:
-                    return cycle_found  # Propaga ciclo encontrado
-
-        self.color[u] = 'PRETO'  # Finaliza visita
+        index = self._index
+        offsets, targets = index.offsets, index.targets
+        color, pi = self.color, self.pi
+        color[u] = CINZA  # Nó sendo visitado (na pilha)
+        stack = [u]
+        cursor = [offsets[u]]
+
+        while stack:
+            x = stack[-1]
+            k, end = cursor[-1], offsets[x + 1]
+            while k < end:  # Retoma a iteração sobre os vizinhos de x
+                v = targets[k]
+                k += 1
+                if color[v] == CINZA:
+                    # Aresta de retorno detectada: ciclo! Sobe por pi de x até v
+                    # e inverte no final (linear, sem insert no início da lista)
+                    reconstructed_cycle = []
+                    current = x
+                    while current != v:
+                        reconstructed_cycle.append(index.label_of(current))
+                        current = pi[current]
+                    reconstructed_cycle.append(index.label_of(v))
+                    reconstructed_cycle.reverse()
+                    return reconstructed_cycle
+                if color[v] == BRANCO:
+                    break
+            else:
+                stack.pop()
+                cursor.pop()
+                color[x] = PRETO  # Finaliza visita
+                continue
+
+            cursor[-1] = k
+            pi[v] = x
+            color[v] = CINZA
+            stack.append(v)
+            cursor.append(offsets[v])
+
         return None
 
 if __name__ == "__main__":
@@ -110,3 +164,4 @@ if __name__ == "__main__":
     finder3 = DFS_Cycle_Finder(grafo_complexo)
     ciclo3 = finder3.find_first_cycle()
     print(f"Ciclo encontrado: {ciclo3}")
+    print(f"Todos os ciclos: {list(finder3.iter_cycles())}")
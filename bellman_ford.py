@@ -1,4 +1,47 @@
-def bellman_ford(vertices, arestas, fonte):
+from array import array
+from collections import deque
+
+from csr import CSRGraph, LabelView, typecode_of
+
+try:
+    import numpy as np
+except ImportError:  # NumPy só é necessário para o modo 'vetorizado'
+    np = None
+
+
+class BellmanFordResult:
+    """
+    Resultado completo do Bellman-Ford.
+
+    Atributos:
+        dist: {vértice: menor distância a partir da fonte}
+        pred: {vértice: predecessor no caminho mínimo, ou None}
+        negative_cycle (list | None): vértices de um ciclo negativo alcançável a partir da
+            fonte, na ordem das arestas, ou None se não houver.
+
+    Para CSRGraph, dist e pred são LabelViews sobre os vetores indexados por id.
+    """
+
+    def __init__(self, dist, pred, negative_cycle=None):
+        self.dist = dist
+        self.pred = pred
+        self.negative_cycle = negative_cycle
+
+    def path(self, v):
+        """Reconstrói (sob demanda) o caminho mínimo da fonte até v, ou None se inalcançável."""
+        if self.negative_cycle is not None:
+            raise ValueError("Caminhos mínimos não estão definidos: o grafo contém ciclo negativo.")
+        if self.dist[v] == float('inf'):
+            return None
+        caminho = []
+        while v is not None:
+            caminho.append(v)
+            v = self.pred[v]
+        caminho.reverse()
+        return caminho
+
+
+def bellman_ford(vertices, arestas, fonte=None, modo='classico'):
     """
     Algoritmo de Bellman-Ford para encontrar os menores caminhos em grafos,
     mesmo com arestas de peso negativo.
@@ -7,40 +50,258 @@ def bellman_ford(vertices, arestas, fonte):
         vertices (list): Lista dos vértices do grafo.
         arestas (list): Lista de tuplas (u, v, peso) representando as arestas.
         fonte (int): Vértice de origem.
+        modo (str): 'classico' (|V|-1 passadas com parada antecipada), 'fila'
+            (SPFA: só relaxa arestas de vértices cuja distância mudou) ou 'vetorizado'
+            (NumPy: relaxa o array inteiro de arestas por passada com np.minimum.at).
+
+    Também aceita um CSRGraph ponderado no lugar das listas: bellman_ford(grafo, fonte).
 
     Returns:
         dict: Dicionário com as menores distâncias da fonte para cada vértice.
               Retorna None se houver ciclo negativo.
     """
-    # Inicializa distâncias
+    resultado = bellman_ford_result(vertices, arestas, fonte, modo)
+    if resultado.negative_cycle is not None:
+        print("O grafo contém ciclo negativo!")
+        return None
+    if isinstance(resultado.dist, LabelView):
+        return resultado.dist.to_dict()
+    return resultado.dist
+
+
+def bellman_ford_result(vertices, arestas, fonte=None, modo='classico'):
+    """
+    Mesmos argumentos de bellman_ford, mas retorna um BellmanFordResult com distâncias,
+    predecessores e, se houver, o ciclo negativo. Os predecessores são mantidos durante as
+    próprias relaxações e o ciclo é recuperado seguindo-os a partir do vértice que ainda
+    relaxou, sem uma segunda execução do algoritmo.
+    """
+    if isinstance(vertices, CSRGraph):
+        grafo, fonte = vertices, arestas
+    elif modo == 'classico':
+        return _bellman_ford_listas(vertices, arestas, fonte)
+    else:
+        grafo = CSRGraph.from_edges(vertices, arestas)
+
+    if modo == 'classico':
+        return _bellman_ford_csr(grafo, fonte)
+    if modo == 'fila':
+        return _bellman_ford_fila(grafo, fonte)
+    if modo == 'vetorizado':
+        return _bellman_ford_vetorizado(grafo, fonte)
+    raise ValueError(f"Modo desconhecido: {modo!r} (use 'classico', 'fila' ou 'vetorizado').")
+
+
+def _ciclo_no_pred(pred, inicio, nenhum):
+    """
+    Segue os predecessores a partir de `inicio`. Se algum vértice se repetir, o trecho
+    repetido é um ciclo do grafo de predecessores (sempre de peso negativo) e é retornado
+    na ordem das arestas; se a cadeia terminar em `nenhum`, retorna None.
+    """
+    posicao = {}
+    percurso = []
+    v = inicio
+    while v != nenhum and v not in posicao:
+        posicao[v] = len(percurso)
+        percurso.append(v)
+        v = pred[v]
+    if v == nenhum:
+        return None
+    ciclo = percurso[posicao[v]:]
+    ciclo.reverse()
+    return ciclo
+
+
+def _bellman_ford_listas(vertices, arestas, fonte):
+    # Inicializa distâncias e predecessores
     dist = {v: float('inf') for v in vertices}
+    pred = {v: None for v in vertices}
     dist[fonte] = 0
 
-    # Relaxa arestas |V|-1 vezes
-    for _ in range(len(vertices) - 1):
-        atualizado = False
+    def relaxa():
+        ultimo = None  # Último vértice cuja distância diminuiu na passada
         for u, v, peso in arestas:
             if dist[u] + peso < dist[v]:
                 dist[v] = dist[u] + peso
-                atualizado = True
+                pred[v] = u
+                ultimo = v
+        return ultimo
+
+    # Relaxa arestas |V|-1 vezes
+    for _ in range(len(vertices) - 1):
         # Se não houve atualização, pode parar cedo
-        if not atualizado:
+        if relaxa() is None:
+            break
+
+    # Verifica ciclo negativo: se ainda há relaxação, segue pred até fechar o ciclo
+    ultimo = relaxa()
+    while ultimo is not None:
+        ciclo = _ciclo_no_pred(pred, ultimo, None)
+        if ciclo is not None:
+            return BellmanFordResult(dist, pred, ciclo)
+        ultimo = relaxa()
+
+    return BellmanFordResult(dist, pred)
+
+
+def _pesos(grafo):
+    """Pesos das arestas do CSRGraph (peso 1 para todas em grafos sem pesos)."""
+    if grafo.weights is not None:
+        return grafo.weights
+    return array('q', [1]) * len(grafo.targets)
+
+
+def _resultado_csr(grafo, dist, pred, ciclo=None):
+    """Empacota os vetores indexados por id em um BellmanFordResult com rótulos."""
+    if ciclo is not None:
+        ciclo = [grafo.label_of(v) for v in ciclo]
+    return BellmanFordResult(LabelView(grafo, dist, missing=None),
+                             LabelView(grafo, pred, missing=-1, as_label=True), ciclo)
+
+
+def _bellman_ford_csr(grafo, fonte):
+    """Bellman-Ford sobre os arrays do CSRGraph, com distâncias indexadas por id."""
+    n = grafo.num_vertices
+    offsets, targets, weights = grafo.offsets, grafo.targets, _pesos(grafo)
+    inf = float('inf')
+
+    dist = [inf] * n
+    pred = array('i', [-1]) * n
+    dist[grafo.id_of(fonte)] = 0
+
+    def relaxa():
+        ultimo = None
+        for u in range(n):
+            du = dist[u]
+            if du == inf:
+                continue
+            a, b = offsets[u], offsets[u + 1]
+            for v, peso in zip(targets[a:b], weights[a:b]):
+                if du + peso < dist[v]:
+                    dist[v] = du + peso
+                    pred[v] = u
+                    ultimo = v
+        return ultimo
+
+    # Relaxa arestas |V|-1 vezes, parando cedo se nada mudar
+    for _ in range(n - 1):
+        if relaxa() is None:
             break
 
     # Verifica ciclo negativo
-    for u, v, peso in arestas:
-        if dist[u] + peso < dist[v]:
-            print("O grafo contém ciclo negativo!")
-            return None
+    ultimo = relaxa()
+    while ultimo is not None:
+        ciclo = _ciclo_no_pred(pred, ultimo, -1)
+        if ciclo is not None:
+            return _resultado_csr(grafo, dist, pred, ciclo)
+        ultimo = relaxa()
+
+    return _resultado_csr(grafo, dist, pred)
+
+
+def _bellman_ford_fila(grafo, fonte):
+    """
+    SPFA: uma fila guarda os vértices cuja distância diminuiu, e só as arestas que saem
+    deles são relaxadas. arestas_no_caminho[v] conta as arestas do passeio que deu a
+    distância atual de v; se chegar a |V|, o passeio repete um vértice e há ciclo negativo
+    alcançável a partir da fonte (a mesma condição detectada pela passada extra do modo
+    clássico). O ciclo é então lido do grafo de predecessores.
+    """
+    n = grafo.num_vertices
+    offsets, targets, weights = grafo.offsets, grafo.targets, _pesos(grafo)
+    inf = float('inf')
+
+    dist = [inf] * n
+    pred = array('i', [-1]) * n
+    arestas_no_caminho = array('q', bytes(8 * n))
+    na_fila = bytearray(n)
+
+    s = grafo.id_of(fonte)
+    dist[s] = 0
+    fila = deque([s])
+    na_fila[s] = 1
+
+    while fila:
+        u = fila.popleft()
+        na_fila[u] = 0
+        du = dist[u]
+        a, b = offsets[u], offsets[u + 1]
+        for v, peso in zip(targets[a:b], weights[a:b]):
+            if du + peso < dist[v]:
+                dist[v] = du + peso
+                pred[v] = u
+                arestas_no_caminho[v] = arestas_no_caminho[u] + 1
+                if arestas_no_caminho[v] >= n:
+                    # Se os predecessores ainda não fecham o ciclo, segue relaxando:
+                    # o ciclo negativo acaba aparecendo no grafo de predecessores
+                    ciclo = _ciclo_no_pred(pred, v, -1)
+                    if ciclo is not None:
+                        return _resultado_csr(grafo, dist, pred, ciclo)
+                if not na_fila[v]:
+                    na_fila[v] = 1
+                    fila.append(v)
+
+    return _resultado_csr(grafo, dist, pred)
+
+
+def _bellman_ford_vetorizado(grafo, fonte):
+    """
+    Cada passada calcula dist[origem] + peso para todas as arestas de uma vez e aplica
+    np.minimum.at sobre os destinos; as arestas que realizaram o mínimo viram predecessores.
+    Para após |V|-1 passadas ou quando nada muda; uma passada extra que ainda melhore
+    alguma distância indica ciclo negativo.
+    """
+    if np is None:
+        raise ImportError("O modo 'vetorizado' requer o NumPy instalado.")
+
+    n = grafo.num_vertices
+    offsets = np.frombuffer(grafo.offsets, dtype=np.int64)
+    origens = np.repeat(np.arange(n), np.diff(offsets))
+    destinos = np.frombuffer(grafo.targets, dtype=np.int32)
+    pesos = np.asarray(_pesos(grafo), dtype=np.float64)
+
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    dist[grafo.id_of(fonte)] = 0
+
+    def relaxa(dist):
+        candidatos = dist[origens] + pesos
+        nova = dist.copy()
+        np.minimum.at(nova, destinos, candidatos)
+        melhorou = (candidatos < dist[destinos]) & (candidatos == nova[destinos])
+        pred[destinos[melhorou]] = origens[melhorou]
+        return nova, destinos[melhorou]
+
+    # Relaxa arestas |V|-1 vezes, parando cedo se nada mudar
+    for _ in range(n - 1):
+        dist, relaxados = relaxa(dist)
+        if len(relaxados) == 0:
+            break
+
+    # Verifica ciclo negativo
+    dist, relaxados = relaxa(dist)
+    while len(relaxados):
+        # Percorre uma cópia array('i'): ids int, como nos modos 'classico' e 'fila'
+        predecessores = array('i', pred.tolist())
+        ciclo = _ciclo_no_pred(predecessores, int(relaxados[-1]), -1)
+        if ciclo is not None:
+            return _resultado_csr(grafo, dist.tolist(), predecessores, ciclo)
+        dist, relaxados = relaxa(dist)
 
-    return dist
+    inteiros = grafo.weights is None or typecode_of(grafo.weights) == 'q'
+    dist = [int(d) if inteiros and d != np.inf else d for d in dist.tolist()]
+    return _resultado_csr(grafo, dist, array('i', pred.tolist()))
 
 # EXEMPLOS
 
 def testar_exemplo(nome, vertices, arestas, fonte):
     print(f"\n=== {nome} ===")
-    resultado = bellman_ford(vertices, arestas, fonte)
-    print("Resultado:", resultado)
+    resultado = bellman_ford_result(vertices, arestas, fonte)
+    if resultado.negative_cycle is not None:
+        print("O grafo contém ciclo negativo:", " -> ".join(map(str, resultado.negative_cycle)))
+    else:
+        print("Resultado:", resultado.dist)
+        print("Caminhos:", {v: resultado.path(v) for v in vertices})
 
 
 if __name__ == "__main__":
@@ -1,4 +1,19 @@
-def bellmore_neuhauser(cost_matrix):
+import heapq
+from array import array
+from itertools import compress
+from math import isfinite
+from operator import add, itemgetter, lt, sub
+
+from coordinates import CoordinateCosts
+from local_search import improve_tour
+
+try:
+    import numpy as np
+except ImportError:  # NumPy só é necessário para o modo 'vetorizado'
+    np = None
+
+
+def bellmore_neuhauser(cost_matrix, mode='incremental', improve=False, start=0):
     """
     Implementa a heurística de Bellmore e Neuhauser para o Problema do Caixeiro Viajante (TSP).
 
@@ -8,8 +23,25 @@ def bellmore_neuhauser(cost_matrix):
     3. Insere a cidade no local que causa o menor aumento no custo total
 
     Parâmetros:
-    cost_matrix : list[list[float]]
-        Matriz de custos/distancias entre cidades (deve ser quadrada e simétrica)
+    cost_matrix : list[list[float]], numpy.ndarray ou coordinates.CoordinateCosts
+        Matriz de custos/distancias entre cidades (deve ser quadrada e simétrica), ou as
+        coordenadas das cidades com distâncias calculadas sob demanda
+    mode : str
+        'incremental' (padrão) mantém as duas menores distâncias de cada cidade ao circuito e
+        atualiza só as distâncias à cidade inserida, O(n²) no total; 'vetorizado' faz o mesmo
+        com operações do NumPy sobre todas as cidades de uma vez (indicado para matrizes
+        ndarray densas); 'classico' recalcula e ordena as distâncias a cada iteração. Todos
+        produzem o mesmo circuito e o mesmo custo (matrizes com custos infinitos ou NaN usam
+        sempre o 'classico'). Com CoordinateCosts, o 'incremental' usa a árvore k-d das
+        coordenadas e memória O(n): os arrependimentos e a escolha da cidade continuam exatos,
+        mas a inserção só testa as arestas das cidades do circuito mais próximas (ver
+        _regret_insertion_spatial), então o circuito pode diferir do da matriz completa.
+    improve : bool ou dict
+        Se verdadeiro, melhora o circuito construído com 2-opt/Or-opt
+        (local_search.improve_tour); um dict é repassado como opções (neighbors,
+        max_iterations, time_limit, on_improve)
+    start : int
+        Cidade que inicia o circuito (padrão 0)
 
     Retorno:
     total_cost : float
@@ -18,14 +50,18 @@ def bellmore_neuhauser(cost_matrix):
         Ordem das cidades no circuito (começa e termina na mesma cidade)
     """
 
+    if mode not in ('incremental', 'vetorizado', 'classico'):
+        raise ValueError(
+            f"Modo desconhecido: {mode!r} (use 'incremental', 'vetorizado' ou 'classico').")
+
     n = len(cost_matrix)
     if n == 0:
         return 0, []
 
     # Controle de cidades visitadas e circuito inicial
     visited = [False] * n
-    tour = [0]  # Começa pela cidade 0
-    visited[0] = True
+    tour = [start]  # Começa pela cidade inicial (0 por padrão)
+    visited[start] = True
 
     # Caso trivial: 1 cidade
     if n == 1:
@@ -35,14 +71,14 @@ def bellmore_neuhauser(cost_matrix):
     # --------------------------------------------------
     # Passo 1: Encontra cidade mais próxima da origem
     min_cost, candidate = float('inf'), None
-    for j in range(1, n):
-        if cost_matrix[0][j] < min_cost:
-            min_cost = cost_matrix[0][j]
+    for j in range(n):
+        if j != start and cost_matrix[start][j] < min_cost:
+            min_cost = cost_matrix[start][j]
             candidate = j
 
-    # Fallback para grafos desconexos
+    # Fallback para grafos desconexos (primeira cidade diferente da inicial)
     if candidate is None:
-        candidate = 1
+        candidate = 1 if start == 0 else 0
 
     visited[candidate] = True
 
@@ -52,27 +88,59 @@ def bellmore_neuhauser(cost_matrix):
     else:
         # Passo 2: Seleciona terceira cidade para minimizar o circuito
         min_cost2, candidate2 = float('inf'), None
-        for k in range(1, n):
+        for k in range(n):
             if visited[k]:
                 continue
-            # Custo do caminho: 0 -> candidate -> k -> 0
-            new_cost = cost_matrix[candidate][k] + cost_matrix[k][0]
+            # Custo do caminho: start -> candidate -> k -> start
+            new_cost = cost_matrix[candidate][k] + cost_matrix[k][start]
             if new_cost < min_cost2:
                 min_cost2 = new_cost
                 candidate2 = k
 
         # Fallback se não encontrou cidade válida
         if candidate2 is None:
-            for k in range(1, n):
+            for k in range(n):
                 if not visited[k]:
                     candidate2 = k
                     break
 
         visited[candidate2] = True
-        tour.extend([candidate, candidate2])  # Circuito inicial: [0, candidate, candidate2]
+        tour.extend([candidate, candidate2])  # Circuito inicial: [start, candidate, candidate2]
 
     # ETAPA 2: Inserção por arrependimento
     # --------------------------------------------------
+    if mode == 'incremental' and isinstance(cost_matrix, CoordinateCosts):
+        _regret_insertion_spatial(cost_matrix, tour, visited)
+    elif mode == 'vetorizado':
+        _regret_insertion_vectorized(cost_matrix, tour, visited)
+    elif mode == 'classico' or not _all_finite(cost_matrix):
+        _regret_insertion_classic(cost_matrix, tour, visited)
+    else:
+        _regret_insertion_incremental(cost_matrix, tour, visited)
+
+    # ETAPA 3 (opcional): busca local sobre o circuito construído
+    # --------------------------------------------------
+    if improve:
+        return improve_tour(cost_matrix, tour, **(improve if isinstance(improve, dict) else {}))
+
+    # Calcula custo total do circuito fechado
+    total_cost = 0
+    for i in range(len(tour)):
+        total_cost += cost_matrix[tour[i]][tour[(i + 1) % len(tour)]]
+
+    return total_cost, tour
+
+
+def _all_finite(cost_matrix):
+    """Verifica se todos os custos de uma matriz densa (listas ou ndarray) são finitos."""
+    if np is not None and isinstance(cost_matrix, np.ndarray):
+        return bool(np.isfinite(cost_matrix).all())
+    return isfinite(sum(map(sum, cost_matrix)))
+
+
+def _regret_insertion_classic(cost_matrix, tour, visited):
+    """Etapa 2 original: recalcula e ordena as distâncias de cada cidade ao circuito."""
+    n = len(cost_matrix)
     unvisited_count = n - len(tour)
     while unvisited_count > 0:
         regrets = {}
@@ -116,12 +184,256 @@ def bellmore_neuhauser(cost_matrix):
         visited[u] = True
         unvisited_count -= 1
 
-    # Calcula custo total do circuito fechado
-    total_cost = 0
-    for i in range(len(tour)):
-        total_cost += cost_matrix[tour[i]][tour[(i + 1) % len(tour)]]
 
-    return total_cost, tour
+def _regret_insertion_incremental(cost_matrix, tour, visited):
+    """
+    Etapa 2 com arrependimentos em cache. Para cada cidade fora do circuito guarda-se as duas
+    menores distâncias a cidades do circuito (d1 <= d2); ao inserir w basta comparar
+    cost_matrix[u][w] com elas, em O(1) por cidade. A inserção só é necessária para a cidade
+    escolhida: os custos das arestas do circuito ficam em cache e a varredura, na ordem do
+    circuito (primeira posição em caso de empate), é feita com map/itemgetter.
+
+    Como a matriz é simétrica, só a linha da cidade inserida é lida (cost_matrix[w][u] no
+    lugar de cost_matrix[u][w]): percorrer colunas de uma lista de listas é bem mais lento.
+    """
+    inf = float('inf')
+    # Cidades fora do circuito em ordem crescente; d1, d2 e regret são alinhados a elas
+    unvisited = [u for u in range(len(cost_matrix)) if not visited[u]]
+
+    # Duas menores distâncias de cada cidade ao circuito e o arrependimento d2 - d1
+    d1, d2, regret = array('d'), array('d'), array('d')
+    for u in unvisited:
+        row, a, b = cost_matrix[u], inf, inf
+        for city in tour:
+            d = row[city]
+            if d < a:
+                a, b = d, a
+            elif d < b:
+                b = d
+        d1.append(a)
+        d2.append(b)
+        regret.append(b - a)
+
+    # edge[k] = custo da aresta tour[k] -> tour[k + 1] (fechando no início)
+    m = len(tour)
+    edge = [cost_matrix[tour[k]][tour[(k + 1) % m]] for k in range(m)]
+
+    while unvisited:
+        # Menor arrependimento; index devolve o primeiro mínimo, ou seja, o menor índice
+        k = regret.index(min(regret))
+        u = unvisited.pop(k)
+        del d1[k], d2[k], regret[k]
+
+        # Aumento de custo de inserir u em cada aresta, na ordem do circuito
+        row = cost_matrix[u]
+        to_u = itemgetter(*tour)(row)             # cost_matrix[tour[k]][u]
+        from_u = to_u[1:] + to_u[:1]              # cost_matrix[u][tour[k + 1]]
+        increases = list(map(sub, map(add, to_u, from_u), edge))
+        best_pos = increases.index(min(increases))
+
+        tour.insert(best_pos + 1, u)
+        edge[best_pos] = to_u[best_pos]
+        edge.insert(best_pos + 1, from_u[best_pos])
+        visited[u] = True
+
+        # Só as distâncias à cidade inserida podem mudar as duas menores de cada cidade
+        # (o filtro d < d2 roda em C; o u extra garante que itemgetter devolva uma tupla)
+        if not unvisited:
+            break
+        dists = itemgetter(*unvisited, u)(row)
+        for k in compress(range(len(unvisited)), map(lt, dists, d2)):
+            d = dists[k]
+            if d < d1[k]:
+                d1[k], d2[k] = d, d1[k]
+            else:
+                d2[k] = d
+            regret[k] = d2[k] - d1[k]
+
+
+def _regret_insertion_vectorized(cost_matrix, tour, visited):
+    """
+    Etapa 2 com NumPy. As duas menores distâncias de cada cidade ao circuito inicial saem de
+    um np.partition sobre a submatriz cidades × circuito; depois, a cada inserção de w, elas
+    são atualizadas para todas as cidades de uma vez com a coluna de w (d1' = min(d1, c),
+    d2' = min(d2, max(d1, c))). Os aumentos de custo são calculados para todas as arestas do
+    circuito de uma vez. argmin devolve o primeiro mínimo, o que preserva os desempates do
+    modo clássico (menor índice de cidade, primeira posição no circuito).
+    """
+    if np is None:
+        raise ImportError("O modo 'vetorizado' requer o NumPy instalado.")
+
+    costs = np.asarray(cost_matrix)
+    if not np.isfinite(costs).all():
+        with np.errstate(invalid='ignore'):  # inf - inf, como no modo clássico
+            return _regret_insertion_classic(cost_matrix, tour, visited)
+
+    n = len(costs)
+    done = np.array(visited, dtype=bool)
+    if done.all():
+        return
+
+    # Duas menores distâncias de cada cidade ao circuito; visitadas ficam com regret infinito
+    two = np.partition(costs[:, tour], 1, axis=1)
+    d1, d2 = two[:, 0].copy(), two[:, 1].copy()
+    regret = (d2 - d1).astype(float)
+    regret[done] = np.inf
+
+    t = np.array(tour, dtype=np.intp)
+    edge = costs[t, np.roll(t, -1)]  # Custo de cada aresta t[k] -> t[k + 1]
+
+    for _ in range(n - len(tour)):
+        u = int(np.argmin(regret))
+
+        # Aumento de custo de inserir u em cada aresta, na ordem do circuito
+        to_u = costs[t, u]
+        from_u = np.roll(costs[u, t], -1)
+        best_pos = int(np.argmin(to_u + from_u - edge))
+
+        t = np.insert(t, best_pos + 1, u)
+        edge[best_pos] = to_u[best_pos]
+        edge = np.insert(edge, best_pos + 1, from_u[best_pos])
+        visited[u] = True
+        done[u] = True
+
+        # Atualiza as duas menores distâncias de todas as cidades com a coluna de u
+        column = costs[:, u]
+        np.minimum(d2, np.maximum(d1, column), out=d2)
+        np.minimum(d1, column, out=d1)
+        np.subtract(d2, d1, out=regret, casting='unsafe')
+        regret[done] = np.inf
+
+    tour[:] = t.tolist()
+
+
+def _regret_insertion_spatial(costs, tour, visited, candidates=8):
+    """
+    Etapa 2 sobre coordenadas, sem matriz, com memória O(n).
+
+    Os arrependimentos são os mesmos do modo incremental (d1 <= d2, as duas menores distâncias
+    ao circuito), mas ao inserir w só se examinam as cidades u com custo(u, w) < d2[u]: cada
+    nó da árvore k-d guarda o maior d2 das suas cidades fora do circuito e é descartado se a
+    sua caixa está mais longe de w que isso. A cidade de menor arrependimento sai de um heap
+    com remoção preguiçosa (desempate pelo menor índice, como nos outros modos). O circuito é
+    uma lista ligada e a inserção testa só as arestas que tocam as `candidates` cidades do
+    circuito mais próximas da escolhida (consulta de vizinhos na árvore), em vez de todas.
+    """
+    n = len(costs)
+    if len(tour) == n:
+        return
+    inf = float('inf')
+    dist, embedded, to_embedded = costs.distance, costs.embedded, costs.to_embedded
+    tree = costs.tree
+    left, right, parent = tree.left, tree.right, tree.parent
+    nodes = len(tree)
+
+    # Circuito como lista ligada
+    succ, pred = array('i', [-1]) * n, array('i', [-1]) * n
+    for k, city in enumerate(tour):
+        succ[city] = tour[(k + 1) % len(tour)]
+        pred[succ[city]] = city
+    in_tour = bytearray(n)
+    tour_count = array('i', bytes(4 * nodes))  # Cidades do circuito em cada nó
+    for city in tour:
+        in_tour[city] = 1
+        tree.add(tour_count, city, 1)
+
+    # Duas menores distâncias ao circuito e heap de (arrependimento, cidade)
+    d1, d2, regret = array('d', [inf]) * n, array('d', [inf]) * n, array('d', [inf]) * n
+    heap = []
+    for u in range(n):
+        if visited[u]:
+            continue
+        a, b = inf, inf
+        for city in tour:
+            d = dist(u, city)
+            if d < a:
+                a, b = d, a
+            elif d < b:
+                b = d
+        d1[u], d2[u], regret[u] = a, b, b - a
+        heap.append((b - a, u))
+    heapq.heapify(heap)
+
+    # bound[nó] = maior d2 (na métrica da árvore) das cidades fora do circuito; -1 se nenhuma
+    bound = array('d', [-1.0]) * nodes
+
+    def refresh(leaf):
+        """Recalcula o limite de uma folha e propaga para cima enquanto ele mudar."""
+        bound[leaf] = max([to_embedded(d2[v]) for v in tree.members(leaf) if not visited[v]],
+                          default=-1.0)
+        node = parent[leaf]
+        while node >= 0:
+            best = max(bound[left[node]], bound[right[node]])
+            if bound[node] == best:
+                break
+            bound[node] = best
+            node = parent[node]
+
+    for node in range(nodes - 1, -1, -1):  # Filhos sempre têm id maior que o pai
+        if left[node] < 0:
+            bound[node] = max([to_embedded(d2[v]) for v in tree.members(node) if not visited[v]],
+                              default=-1.0)
+        else:
+            bound[node] = max(bound[left[node]], bound[right[node]])
+
+    for _ in range(n - len(tour)):
+        # Menor arrependimento; entradas desatualizadas são descartadas
+        while True:
+            r, u = heapq.heappop(heap)
+            if not visited[u] and r == regret[u]:
+                break
+
+        # Melhor aresta entre as que tocam as cidades do circuito mais próximas de u
+        best_increase, best_edge = inf, None
+        for _, x in tree.nearest(embedded[u], candidates, tour_count, in_tour):
+            for i, j in ((pred[x], x), (x, succ[x])):
+                increase = dist(i, u) + dist(u, j) - dist(i, j)
+                if increase < best_increase:
+                    best_increase, best_edge = increase, (i, j)
+        if best_edge is None:
+            best_edge = (tour[0], succ[tour[0]])  # Custos infinitos/NaN: qualquer aresta
+        i, j = best_edge
+        succ[i], pred[u], succ[u], pred[j] = u, i, j, u
+        visited[u] = True
+        in_tour[u] = 1
+        tree.add(tour_count, u, 1)
+
+        # Cidades cuja segunda menor distância ao circuito diminui com u
+        dirty = {tree.leaf_of[u]}
+        point = embedded[u]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            b = bound[node]
+            # Folga relativa: a caixa e os limites vêm de contas em ponto flutuante diferentes
+            if b < 0 or tree.min_dist(node, point) > b * (1 + 1e-9):
+                continue
+            if left[node] >= 0:
+                stack.append(left[node])
+                stack.append(right[node])
+                continue
+            for v in tree.members(node):
+                if visited[v]:
+                    continue
+                d = dist(v, u)
+                if d < d2[v]:
+                    if d < d1[v]:
+                        d1[v], d2[v] = d, d1[v]
+                    else:
+                        d2[v] = d
+                    regret[v] = d2[v] - d1[v]
+                    heapq.heappush(heap, (regret[v], v))
+                    dirty.add(node)
+        for leaf in dirty:
+            refresh(leaf)
+
+    # Reescreve o circuito a partir da cidade inicial
+    first = tour[0]
+    tour[:] = [first]
+    city = succ[first]
+    while city != first:
+        tour.append(city)
+        city = succ[city]
 
 
 # -------------------------- EXEMPLO DE USO ---------------------------
@@ -0,0 +1,270 @@
+"""
+    Nome da Tarefa: Índice de pontes (2-aresta-conectividade)
+
+    Descrição: Calcula todas as pontes de um multigrafo não direcionado com uma única passada
+    do algoritmo de Tarjan (low-link) e mantém o resultado sob remoção de arestas, de modo que
+    a pergunta "(u, v) é ponte?" é respondida em O(1). Remover uma ponte não muda o status de
+    nenhuma outra aresta; remover uma aresta que não é ponte só pode criar pontes dentro da
+    sua componente 2-aresta-conexa. Essa componente é marcada como pendente: as consultas nela
+    tentam primeiro uma busca bidirecional local com orçamento limitado e, se ela não decidir,
+    a componente é recalculada uma única vez, não importa quantas remoções ocorreram nela.
+"""
+
+from array import array
+
+from csr import Multigraph
+
+
+class BridgeIndex:
+    """Pontes e componentes 2-aresta-conexas de um multigrafo, atualizadas sob remoções"""
+
+    def __init__(self, graph):
+        multigraph = graph if isinstance(graph, Multigraph) else Multigraph(graph)
+        self.multigraph = multigraph
+        self.graph = multigraph.graph
+        n, m = self.graph.num_vertices, multigraph.num_edges
+
+        self.bridge = bytearray(m)     # 1 se a aresta é ponte (nunca um falso positivo)
+        self.deleted = bytearray(m)    # 1 se a aresta foi removida
+        self.component = array('i', [-1]) * n  # Componente 2-aresta-conexa de cada vértice
+        self._sizes = []               # Número de vértices de cada componente, por id
+        self._dirty = {}               # Componente pendente -> pontas das arestas removidas
+        self._pairs = None             # (u, v) -> ids das arestas vivas; criado sob demanda
+
+        # Cópia da incidência em que as arestas vivas de u ficam em edges[offsets[u]:end[u]];
+        # slot[2e] e slot[2e + 1] são as posições de e nas listas de a[e] e de b[e]
+        self._edges = edges = array('i', multigraph.edges)
+        self._end = array('q', multigraph.offsets[1:])
+        self._slot = slot = array('q', [-1]) * (2 * m)
+        a = multigraph.a
+        for u in range(n):
+            for k in range(multigraph.offsets[u], multigraph.offsets[u + 1]):
+                e = edges[k]
+                if a[e] == u and slot[2 * e] < 0:
+                    slot[2 * e] = k
+                else:
+                    slot[2 * e + 1] = k
+
+        # Vetores de trabalho do Tarjan, reaproveitados nos recálculos
+        self._disc = array('i', bytes(4 * n))
+        self._low = array('i', bytes(4 * n))
+        self._cursor = array('q', bytes(8 * n))
+        self._seen = array('i', bytes(4 * n))  # Passada em que o vértice foi visitado
+        self._pass = 0
+
+        self._tarjan(range(n))
+
+    def is_bridge_edge(self, e):
+        """O(1) amortizado: a aresta de id e (ainda presente) é ponte?"""
+        if self.deleted[e]:
+            return False
+        if self.bridge[e]:
+            return True  # Remoções nunca desfazem uma ponte
+        c = self.component[self.multigraph.a[e]]
+        if c not in self._dirty:
+            return False
+
+        # Componente pendente: uma busca local limitada a uma fração do custo de recalcular
+        # costuma decidir sozinha (ciclos curtos em grafos densos, lados pequenos em esparsos)
+        found = self._on_cycle(e, self._sizes[c] // 4 + 2)
+        if found is None:
+            self._refresh(c)
+        elif not found:
+            self.bridge[e] = 1
+            self._dirty[c] += (self.multigraph.a[e], self.multigraph.b[e])
+        return bool(self.bridge[e])
+
+    def is_bridge(self, u, v):
+        """
+        O(1) amortizado: existe exatamente uma aresta viva entre os vértices u e v e ela é
+        ponte? Arestas paralelas nunca são pontes.
+        """
+        edges = self._pair_edges(u, v)
+        return len(edges) == 1 and self.is_bridge_edge(edges[0])
+
+    def bridges(self):
+        """Lista de pares (u, v) de rótulos das pontes atuais."""
+        for c in list(self._dirty):
+            self._refresh(c)
+        a, b, label = self.multigraph.a, self.multigraph.b, self.graph.label_of
+        return [(label(a[e]), label(b[e])) for e in range(self.multigraph.num_edges)
+                if self.bridge[e] and not self.deleted[e]]
+
+    def two_edge_connected(self, u, v):
+        """Os vértices u e v estão na mesma componente 2-aresta-conexa?"""
+        x, y = self.graph.id_of(u), self.graph.id_of(v)
+        self._refresh(self.component[x])
+        self._refresh(self.component[y])
+        return self.component[x] == self.component[y]
+
+    def remove_edge(self, u, v):
+        """Remove uma aresta viva entre u e v (rótulos) e atualiza as pontes."""
+        edges = self._pair_edges(u, v)
+        if not edges:
+            raise ValueError(f"Não há aresta entre '{u}' e '{v}'.")
+        self.remove_edge_id(edges[-1])
+
+    def remove_edge_id(self, e):
+        """Remove a aresta de id e em O(1); a componente afetada fica pendente."""
+        if self.deleted[e]:
+            return
+        self.deleted[e] = 1
+        a, b = self.multigraph.a[e], self.multigraph.b[e]
+        self._unlink(e, 0, a)
+        self._unlink(e, 1, b)
+        if self._pairs is not None:
+            self._pairs[(min(a, b), max(a, b))].remove(e)
+        if self.bridge[e]:
+            return  # Remover uma ponte não altera o status das demais arestas
+
+        # Cada pedaço em que a componente se partir contém a ponta de alguma aresta removida
+        # (ou de uma ponte marcada pela busca local), então essas pontas são as raízes
+        roots = self._dirty.setdefault(self.component[a], [])
+        roots.append(a)
+        roots.append(b)
+
+    def _pair_edges(self, u, v):
+        if self._pairs is None:
+            pairs = {}
+            a, b, deleted = self.multigraph.a, self.multigraph.b, self.deleted
+            for e in range(self.multigraph.num_edges):
+                if not deleted[e]:
+                    pairs.setdefault((min(a[e], b[e]), max(a[e], b[e])), []).append(e)
+            self._pairs = pairs
+        x, y = self.graph.id_of(u), self.graph.id_of(v)
+        return self._pairs.get((min(x, y), max(x, y)), [])
+
+    def _on_cycle(self, e, budget):
+        """
+        Busca bidirecional a partir das duas pontas de e, sem usar e nem pontes conhecidas.
+        Retorna True se as buscas se encontram (e está em um ciclo, não é ponte), False se um
+        lado se esgota sozinho (e é ponte) e None se o orçamento de vértices acabar antes.
+        """
+        mg = self.multigraph
+        a, b, offsets, edges, end, bridge = mg.a, mg.b, mg.offsets, self._edges, self._end, self.bridge
+        u, v = a[e], b[e]
+        if u == v:
+            return True  # Laços nunca são pontes
+        side = {u: 0, v: 1}
+        stacks = ([u], [v])
+        while budget > 0:
+            for s in (0, 1):
+                stack = stacks[s]
+                if not stack:
+                    return False
+                x = stack.pop()
+                budget -= 1
+                for f in edges[offsets[x]:end[x]]:
+                    if f == e or bridge[f]:
+                        continue
+                    y = a[f] ^ b[f] ^ x
+                    t = side.get(y)
+                    if t is None:
+                        side[y] = s
+                        stack.append(y)
+                    elif t != s:
+                        return True
+        return None
+
+    def _unlink(self, e, side, u):
+        """Troca e com a última aresta viva da lista de u e encurta a lista (O(1))."""
+        edges, slot, a = self._edges, self._slot, self.multigraph.a
+        k, last = slot[2 * e + side], self._end[u] - 1
+        f = edges[last]
+        edges[k], edges[last] = f, e
+        if slot[2 * f] == last and a[f] == u:
+            slot[2 * f] = k
+        else:
+            slot[2 * f + 1] = k
+        slot[2 * e + side] = last
+        self._end[u] = last
+
+    def _refresh(self, c):
+        """Recalcula a componente pendente c a partir das pontas das arestas removidas."""
+        roots = self._dirty.pop(c, None)
+        if roots is not None:
+            self._tarjan(roots)
+
+    def _tarjan(self, roots):
+        """
+        Low-link iterativo a partir das raízes dadas. Só as arestas vivas são percorridas e as
+        já marcadas como ponte são ignoradas, então a busca nunca sai da componente sendo recalculada. As
+        componentes 2-aresta-conexas são numeradas na mesma passada: ao detectar a ponte
+        (p, u), os vértices empilhados desde u formam uma componente.
+        """
+        mg = self.multigraph
+        a, b, offsets = mg.a, mg.b, mg.offsets
+        edges, end = self._edges, self._end
+        disc, low, cursor, seen = self._disc, self._low, self._cursor, self._seen
+        bridge, component = self.bridge, self.component
+        self._pass += 1
+        stamp = self._pass
+        timer = 0
+
+        for r in roots:
+            if seen[r] == stamp:
+                continue
+            seen[r] = stamp
+            disc[r] = low[r] = timer
+            timer += 1
+            cursor[r] = offsets[r]
+            stack = [(r, -1)]  # (vértice, id da aresta pela qual foi descoberto)
+            visited = [r]      # Vértices ainda sem componente, em ordem de descoberta
+            while stack:
+                u, parent_edge = stack[-1]
+                k = cursor[u]
+                if k < end[u]:
+                    cursor[u] = k + 1
+                    e = edges[k]
+                    # Só a própria aresta de descoberta é ignorada: paralelas contam como retorno
+                    if e == parent_edge or bridge[e]:
+                        continue
+                    v = a[e] ^ b[e] ^ u
+                    if seen[v] != stamp:
+                        seen[v] = stamp
+                        disc[v] = low[v] = timer
+                        timer += 1
+                        cursor[v] = offsets[v]
+                        stack.append((v, e))
+                        visited.append(v)
+                    elif disc[v] < low[u]:
+                        low[u] = disc[v]
+                    continue
+
+                stack.pop()
+                if stack:
+                    p = stack[-1][0]
+                    if low[u] < low[p]:
+                        low[p] = low[u]
+                    if low[u] <= disc[p]:
+                        continue
+                    bridge[parent_edge] = 1
+                # u fecha uma componente: todos os vértices descobertos a partir dele
+                c = len(self._sizes)
+                size = len(visited)
+                while True:
+                    x = visited.pop()
+                    component[x] = c
+                    if x == u:
+                        break
+                self._sizes.append(size - len(visited))
+
+
+if __name__ == "__main__":
+    # Dois triângulos ligados pela aresta C-D, mais uma aresta dupla D-E
+    grafo = {
+        'A': {'B': 1, 'C': 1},
+        'B': {'A': 1, 'C': 1},
+        'C': {'A': 1, 'B': 1, 'D': 1},
+        'D': {'C': 1, 'E': 2},
+        'E': {'D': 2}
+    }
+    indice = BridgeIndex(grafo)
+    print("Pontes:", indice.bridges())                    # [('C', 'D')]
+    print("C-D é ponte?", indice.is_bridge('C', 'D'))      # True
+    print("D-E é ponte?", indice.is_bridge('D', 'E'))      # False (aresta dupla)
+
+    indice.remove_edge('A', 'B')
+    print("Após remover A-B:", indice.bridges())          # A-C, B-C e C-D
+    indice.remove_edge('D', 'E')
+    print("Após remover uma D-E:", indice.bridges())      # D-E também vira ponte
@@ -0,0 +1,245 @@
+"""
+    Nome da Tarefa: Custos do PCV a partir de coordenadas
+
+    Descrição: Em vez de uma matriz n × n, guarda só as coordenadas das cidades (planas ou
+    latitude/longitude) e calcula as distâncias (euclidiana ou haversine) sob demanda, de modo
+    que a memória cresce em O(n). O objeto se comporta como a matriz (costs[u][v]), mantém um
+    cache LRU limitado de linhas inteiras e traz uma árvore k-d estática para consultas de
+    vizinhos mais próximos, usada pelo bellmore_neuhauser e pela busca local.
+"""
+
+import heapq
+import math
+from array import array
+from collections import OrderedDict
+
+EARTH_RADIUS_KM = 6371.0088  # Raio médio da Terra
+
+
+class KDTree:
+    """
+    Árvore k-d estática e balanceada sobre pontos (tuplas de mesma dimensão), em listas
+    paralelas indexadas por nó. As folhas guardam até leaf_size pontos em perm[start:end].
+    Contadores por nó (ver add) permitem buscar só entre pontos "ativos".
+    """
+
+    def __init__(self, points, leaf_size=8):
+        self.points = points
+        n = len(points)
+        self.perm = list(range(n))
+        self.lo, self.hi = [], []               # Caixa envolvente de cada nó
+        self.left, self.right, self.parent = [], [], []
+        self.start, self.end = [], []
+        self.leaf_of = array('i', [-1]) * n
+
+        if n == 0:
+            return
+        dim = len(points[0])
+        stack = [(0, n, -1, None)]  # (início, fim, pai, lado)
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(self.lo)
+            members = [points[i] for i in self.perm[start:end]]
+            lo = tuple(min(p[d] for p in members) for d in range(dim))
+            hi = tuple(max(p[d] for p in members) for d in range(dim))
+            self.lo.append(lo)
+            self.hi.append(hi)
+            self.left.append(-1)
+            self.right.append(-1)
+            self.parent.append(parent)
+            self.start.append(start)
+            self.end.append(end)
+            if parent >= 0:
+                (self.left if side == 0 else self.right)[parent] = node
+
+            if end - start <= leaf_size:
+                for i in self.perm[start:end]:
+                    self.leaf_of[i] = node
+                continue
+            # Divide pela mediana da dimensão mais espalhada
+            axis = max(range(dim), key=lambda d: hi[d] - lo[d])
+            self.perm[start:end] = sorted(self.perm[start:end], key=lambda i: points[i][axis])
+            middle = (start + end) // 2
+            stack.append((middle, end, node, 1))
+            stack.append((start, middle, node, 0))
+
+    def __len__(self):
+        return len(self.lo)
+
+    def min_dist(self, node, point):
+        """Menor distância euclidiana do ponto à caixa do nó."""
+        total = 0.0
+        for x, lo, hi in zip(point, self.lo[node], self.hi[node]):
+            if x < lo:
+                total += (lo - x) ** 2
+            elif x > hi:
+                total += (x - hi) ** 2
+        return math.sqrt(total)
+
+    def members(self, node):
+        """Pontos de uma folha."""
+        return self.perm[self.start[node]:self.end[node]]
+
+    def add(self, count, i, delta):
+        """Soma delta ao contador de todos os nós do caminho do ponto i até a raiz."""
+        node = self.leaf_of[i]
+        while node >= 0:
+            count[node] += delta
+            node = self.parent[node]
+
+    def nearest(self, point, k, count=None, active=None, exclude=-1):
+        """
+        Os k pontos mais próximos de point, como lista de (distância euclidiana, id) em ordem
+        crescente. Com count/active, só considera os pontos i com active[i] verdadeiro (count
+        é o contador por nó mantido com add).
+        """
+        if k <= 0 or not self.lo:
+            return []
+        points, left, right = self.points, self.left, self.right
+        best = []  # Heap de máximo: (-distância, -id)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if count is not None and count[node] == 0:
+                continue
+            if len(best) == k and self.min_dist(node, point) > -best[0][0]:
+                continue
+            if left[node] < 0:
+                for i in self.perm[self.start[node]:self.end[node]]:
+                    if i == exclude or (active is not None and not active[i]):
+                        continue
+                    item = (-math.dist(points[i], point), -i)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                continue
+            # Visita primeiro o filho mais próximo (empilhado por último)
+            a, b = left[node], right[node]
+            if self.min_dist(a, point) < self.min_dist(b, point):
+                a, b = b, a
+            stack.append(a)
+            stack.append(b)
+        return sorted((-d, -i) for d, i in best)
+
+
+class CoordinateCosts:
+    """
+    "Matriz" de custos calculada a partir de coordenadas.
+
+    Parâmetros:
+    points : list[tuple[float, ...]]
+        Coordenadas das cidades: (x, y) para 'euclidean' ou (latitude, longitude) em graus
+        para 'haversine'
+    metric : str
+        'euclidean' ou 'haversine' (distância sobre a esfera, em km por padrão)
+    cache_rows : int
+        Quantas linhas inteiras manter no cache LRU
+    radius : float
+        Raio da esfera para 'haversine'
+
+    costs[u][v] e costs.distance(u, v) custam O(1); costs.row(u) materializa (e guarda no
+    cache) a linha u inteira. costs.tree é uma árvore k-d sobre as coordenadas "embutidas"
+    (o próprio plano, ou pontos 3D na esfera para 'haversine', onde a distância em linha reta
+    cresce junto com a distância sobre a esfera).
+    """
+
+    def __init__(self, points, metric='euclidean', cache_rows=64, radius=EARTH_RADIUS_KM):
+        self.points = [tuple(map(float, p)) for p in points]
+        self.metric = metric
+        self.radius = radius
+        self.cache_rows = cache_rows
+        self._rows = OrderedDict()
+        self._tree = None
+
+        if metric == 'euclidean':
+            self.embedded = self.points
+        elif metric == 'haversine':
+            self._lat = [math.radians(lat) for lat, _ in self.points]
+            self._lon = [math.radians(lon) for _, lon in self.points]
+            self._cos_lat = [math.cos(lat) for lat in self._lat]
+            self.embedded = [(radius * c * math.cos(lon), radius * c * math.sin(lon),
+                              radius * math.sin(lat))
+                             for lat, lon, c in zip(self._lat, self._lon, self._cos_lat)]
+        else:
+            raise ValueError(f"Métrica desconhecida: {metric!r} (use 'euclidean' ou 'haversine').")
+
+    def __len__(self):
+        return len(self.points)
+
+    def __getitem__(self, u):
+        n = len(self.points)
+        if u < 0:
+            u += n  # Índices negativos como numa lista de linhas
+        if not 0 <= u < n:
+            raise IndexError("Índice de cidade fora do intervalo.")
+        return _Row(self, u)
+
+    def distance(self, u, v):
+        """Custo entre as cidades u e v."""
+        if self.metric == 'euclidean':
+            return math.dist(self.points[u], self.points[v])
+        lat1, lat2 = self._lat[u], self._lat[v]
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + self._cos_lat[u] * self._cos_lat[v] * math.sin((self._lon[v] - self._lon[u]) / 2) ** 2)
+        return 2 * self.radius * math.asin(math.sqrt(min(1.0, a)))
+
+    def to_embedded(self, d):
+        """Converte um custo na distância em linha reta correspondente na árvore k-d."""
+        if self.metric == 'euclidean':
+            return d
+        return 2 * self.radius * math.sin(min(d, math.pi * self.radius) / (2 * self.radius))
+
+    def row(self, u):
+        """Linha u inteira (array 'd'), guardada no cache LRU."""
+        rows = self._rows
+        if u in rows:
+            rows.move_to_end(u)
+            return rows[u]
+        row = array('d', (self.distance(u, v) for v in range(len(self.points))))
+        rows[u] = row
+        if len(rows) > self.cache_rows:
+            rows.popitem(last=False)
+        return row
+
+    @property
+    def tree(self):
+        """Árvore k-d sobre as coordenadas embutidas, construída no primeiro uso."""
+        if self._tree is None:
+            self._tree = KDTree(self.embedded)
+        return self._tree
+
+    def nearest(self, u, k):
+        """As k cidades mais próximas de u (sem a própria u), em ordem crescente de custo."""
+        found = self.tree.nearest(self.embedded[u], k, exclude=u)
+        return [v for _, v in found]
+
+
+class _Row:
+    """Linha preguiçosa costs[u]: cada acesso calcula uma distância (ou lê a linha em cache)."""
+
+    __slots__ = ('costs', 'u')
+
+    def __init__(self, costs, u):
+        self.costs, self.u = costs, u
+
+    def __getitem__(self, v):
+        row = self.costs._rows.get(self.u)
+        if row is not None:
+            return row[v]
+        return self.costs.distance(self.u, v)
+
+    def __len__(self):
+        return len(self.costs)
+
+    def __iter__(self):
+        return iter(self.costs.row(self.u))
+
+
+if __name__ == "__main__":
+    # Capitais do Sudeste (latitude, longitude)
+    capitais = ['São Paulo', 'Rio de Janeiro', 'Belo Horizonte', 'Vitória']
+    costs = CoordinateCosts([(-23.55, -46.63), (-22.91, -43.17), (-19.92, -43.94),
+                             (-20.32, -40.34)], metric='haversine')
+    print(f"São Paulo -> Rio de Janeiro: {costs[0][1]:.1f} km")
+    print("Mais próximas de Vitória:", [capitais[v] for v in costs.nearest(3, 2)])
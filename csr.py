@@ -0,0 +1,440 @@
+"""
+    Nome da Tarefa: Representação CSR (Compressed Sparse Row)
+
+    Descrição: Representação compacta de grafos baseada em arrays contíguos (offsets, targets e
+    weights), compartilhada por todos os algoritmos do repositório. Os vizinhos do vértice de id
+    i ficam em targets[offsets[i]:offsets[i + 1]]. Rótulos arbitrários (hashable) são mapeados
+    para ids inteiros densos; quando os rótulos já são 0..n-1 nenhum mapa é armazenado.
+"""
+
+import operator
+from array import array
+from collections.abc import Mapping
+
+
+def typecode_of(values):
+    """Typecode de um array, ou formato de um memoryview (arrays mapeados de arquivo)."""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+def _is_identity(labels):
+    """Verifica se os rótulos são exatamente os inteiros 0..n-1, em ordem."""
+    return all(type(label) is int and label == i for i, label in enumerate(labels))
+
+
+def _integral_id(label):
+    """
+    Rótulo inteiro (int, numpy.int64, ...) como int, para grafos sem mapa de rótulos;
+    None se não for inteiro ou for bool (que não é tratado como vértice 0 ou 1).
+    """
+    if isinstance(label, bool):
+        return None
+    try:
+        return operator.index(label)
+    except TypeError:
+        return None
+
+
+class CSRGraph:
+    """Grafo em formato CSR com mapa rótulo ↔ id inteiro"""
+
+    def __init__(self, offsets, targets, weights=None, labels=None, directed=True):
+        self.offsets = offsets      # array('q') com n + 1 posições
+        self.targets = targets      # array('i') com os ids dos vizinhos
+        self.weights = weights      # array('q') ou array('d') paralelo a targets, ou None
+        self.directed = directed
+        self.num_vertices = len(offsets) - 1
+
+        # Rótulos: None significa que o rótulo de cada vértice é o próprio id
+        if labels is not None and _is_identity(labels):
+            labels = None
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)} if labels is not None else None
+        self._ordered = None        # Cache do índice de ordem determinística (ver ordered)
+        self._transposed = None     # Cache do grafo transposto (ver transpose)
+
+    # ------------------------------------------------------------------
+    # Construtores
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_edges(cls, vertices, edges, directed=True):
+        """
+        Constrói o grafo a partir de uma lista de vértices e de tuplas (u, v) ou (u, v, peso),
+        como as usadas em bellman_ford. Grafos não direcionados armazenam as duas direções.
+        """
+        labels = list(vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        n = len(labels)
+
+        src, dst, wts = array('i'), array('i'), []
+        weighted = False
+        integral = True  # pesos inteiros são guardados em array('q') para não virarem float
+        for edge in edges:
+            if edge[0] not in index or edge[1] not in index:
+                raise ValueError("Vértices devem pertencer ao grafo.")
+            u, v = index[edge[0]], index[edge[1]]
+            if len(edge) > 2:
+                w = edge[2]
+                weighted = True
+                integral = integral and isinstance(w, int)
+            else:
+                w = 1
+            src.append(u)
+            dst.append(v)
+            wts.append(w)
+            if not directed:
+                src.append(v)
+                dst.append(u)
+                wts.append(w)
+
+        # Ordenação por contagem (estável): preserva a ordem de inserção em cada linha
+        offsets = array('q', bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        m = len(src)
+        targets = array('i', bytes(4 * m))
+        weights = array('q' if integral else 'd', bytes(8 * m)) if weighted else None
+        pos = array('q', offsets)
+        for k in range(m):
+            u = src[k]
+            p = pos[u]
+            targets[p] = dst[k]
+            if weighted:
+                weights[p] = wts[k]
+            pos[u] = p + 1
+
+        return cls(offsets, targets, weights, labels, directed)
+
+    @classmethod
+    def from_adjacency(cls, adj, directed=True):
+        """
+        Constrói o grafo a partir de um dicionário de adjacência. Aceita os dois formatos do
+        repositório: {v: [vizinhos]} (DFS, BFS) e {v: {vizinho: quantidade_arestas}} (fleury),
+        em que cada quantidade vira arestas paralelas. As linhas são copiadas como estão, então
+        um dicionário não direcionado já deve conter as duas direções.
+        """
+        labels = list(adj.keys())
+        index = {label: i for i, label in enumerate(labels)}
+
+        # Vizinhos que não são chaves também viram vértices (sem arestas de saída)
+        for neighbors in adj.values():
+            for v in neighbors:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+
+        offsets = array('q', [0])
+        targets = array('i')
+        for label in labels:
+            neighbors = adj.get(label, ())
+            if isinstance(neighbors, dict):
+                for v, count in neighbors.items():
+                    targets.extend([index[v]] * count)
+            else:
+                targets.extend(index[v] for v in neighbors)
+            offsets.append(len(targets))
+
+        return cls(offsets, targets, None, labels, directed)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Converte qualquer representação do repositório: GraphMatrix, GraphList (graph.py),
+        GraphAdjList (BFS.py), dicionários de adjacência ou um CSRGraph (devolvido como está).
+        """
+        if isinstance(graph, cls):
+            return graph
+        if isinstance(graph, dict):
+            return cls.from_adjacency(graph)
+        if hasattr(graph, 'bits'):  # GraphMatrix (linhas em bits)
+            offsets = array('q', [0])
+            targets = array('i')
+            for i in range(graph.num_vertices):
+                targets.extend(graph.neighbors(i))
+                offsets.append(len(targets))
+            return cls(offsets, targets, None, None, directed=False)
+        if hasattr(graph, 'adj_list'):  # GraphList
+            offsets = array('q', [0])
+            targets = array('i')
+            for neighbors in graph.adj_list:
+                targets.extend(neighbors)
+                offsets.append(len(targets))
+            return cls(offsets, targets, None, None, directed=False)
+        if hasattr(graph, 'adj'):  # GraphAdjList
+            return cls.from_adjacency(graph.adj, directed=graph.directed)
+        raise TypeError(f"Representação de grafo não suportada: {type(graph).__name__}")
+
+    # ------------------------------------------------------------------
+    # Mapa rótulo ↔ id
+    # ------------------------------------------------------------------
+    def id_of(self, label):
+        """Id inteiro do vértice com o rótulo dado."""
+        if self.index is not None:
+            if label not in self.index:
+                raise ValueError("Vértices devem pertencer ao grafo.")
+            return self.index[label]
+        i = _integral_id(label)
+        if i is not None and 0 <= i < self.num_vertices:
+            return i
+        raise ValueError("Vértices devem pertencer ao grafo.")
+
+    def label_of(self, i):
+        """Rótulo do vértice com o id dado."""
+        return i if self.labels is None else self.labels[i]
+
+    # ------------------------------------------------------------------
+    # Consultas por id
+    # ------------------------------------------------------------------
+    @property
+    def num_edges(self):
+        """Número de arestas (cada aresta não direcionada conta uma vez)."""
+        m = len(self.targets)
+        return m if self.directed else m // 2
+
+    def neighbors(self, i):
+        """Ids dos vizinhos do vértice i (fatia sem cópia de targets)."""
+        return memoryview(self.targets)[self.offsets[i]:self.offsets[i + 1]]
+
+    def out_degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def ordered(self):
+        """
+        Índice de ordem determinística: cópia do grafo em que os ids seguem a ordem
+        crescente dos rótulos e cada linha está ordenada. Percorrer os ids 0..n-1 e as
+        linhas na ordem armazenada equivale a usar sorted() nos vértices e vizinhos.
+        É construído uma única vez e reaproveitado (o CSRGraph não muda após criado).
+        """
+        if self._ordered is not None:
+            return self._ordered
+
+        n = self.num_vertices
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        order = sorted(range(n), key=self.label_of) if self.labels is not None else range(n)
+        rank = array('i', bytes(4 * n))
+        for new_id, old_id in enumerate(order):
+            rank[old_id] = new_id
+
+        new_offsets = array('q', [0])
+        new_targets = array('i')
+        new_weights = array(typecode_of(weights)) if weights is not None else None
+        for old_id in order:
+            a, b = offsets[old_id], offsets[old_id + 1]
+            if weights is None:
+                row = targets[a:b] if self.labels is None else (rank[t] for t in targets[a:b])
+                new_targets.extend(sorted(row))
+            else:
+                for k in sorted(range(a, b), key=lambda k: rank[targets[k]]):
+                    new_targets.append(rank[targets[k]])
+                    new_weights.append(weights[k])
+            new_offsets.append(len(new_targets))
+
+        labels = [self.label_of(i) for i in order] if self.labels is not None else None
+        result = CSRGraph(new_offsets, new_targets, new_weights, labels, self.directed)
+        result._ordered = result
+        self._ordered = result
+        return result
+
+    def transpose(self):
+        """
+        Grafo com todas as arestas invertidas, construído por contagem em O(V + E) e guardado
+        em cache; as linhas de vizinhos de entrada ficam em ordem crescente de origem. Para
+        grafos não direcionados é o próprio grafo.
+        """
+        if not self.directed:
+            return self
+        if self._transposed is not None:
+            return self._transposed
+
+        n = self.num_vertices
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        m = len(targets)
+        in_offsets = array('q', bytes(8 * (n + 1)))
+        for v in targets:
+            in_offsets[v + 1] += 1
+        for i in range(n):
+            in_offsets[i + 1] += in_offsets[i]
+
+        in_targets = array('i', bytes(4 * m))
+        in_weights = array(typecode_of(weights), bytes(weights.itemsize * m)) if weights is not None else None
+        pos = array('q', in_offsets)
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                p = pos[v]
+                in_targets[p] = u
+                if weights is not None:
+                    in_weights[p] = weights[k]
+                pos[v] = p + 1
+
+        result = CSRGraph(in_offsets, in_targets, in_weights, None, directed=True)
+        result.labels, result.index = self.labels, self.index  # Mesmo mapa de rótulos, sem cópia
+        result._transposed = self
+        self._transposed = result
+        return result
+
+    def edges(self):
+        """Gera tuplas (u, v, peso) por id; o peso é 1 em grafos sem pesos."""
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.num_vertices):
+            for k in range(offsets[u], offsets[u + 1]):
+                yield u, targets[k], (weights[k] if weights is not None else 1)
+
+    # ------------------------------------------------------------------
+    # Interface por rótulo (compatível com dicionários e GraphAdjList)
+    # ------------------------------------------------------------------
+    @property
+    def vertices(self):
+        return self.keys()
+
+    def keys(self):
+        return self.index.keys() if self.index is not None else range(self.num_vertices)
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, label):
+        if self.index is not None:
+            return label in self.index
+        i = _integral_id(label)
+        return i is not None and 0 <= i < self.num_vertices
+
+    def get_neighbors(self, label):
+        """Rótulos dos vizinhos do vértice (mesma interface de GraphAdjList)."""
+        i = self.id_of(label)
+        if self.labels is None:
+            return list(self.neighbors(i))
+        labels = self.labels
+        return [labels[j] for j in self.neighbors(i)]
+
+    def get(self, label, default=None):
+        """Mesma interface de dict.get sobre {rótulo: [vizinhos]}."""
+        if label not in self:
+            return default
+        return self.get_neighbors(label)
+
+    def __repr__(self):
+        kind = "direcionado" if self.directed else "não direcionado"
+        return f"CSRGraph({self.num_vertices} vértices, {self.num_edges} arestas, {kind})"
+
+
+class Multigraph:
+    """
+    Multigrafo não direcionado em arrays, com cada aresta identificada por um id.
+
+    As pontas da aresta e ficam em a[e] e b[e]; as arestas incidentes ao vértice u ficam em
+    edges[offsets[u]:offsets[u + 1]] (um laço aparece duas vezes). O vizinho de u pela aresta
+    e é a[e] ^ b[e] ^ u. Aceita o formato {vértice: {vizinho: quantidade_arestas}} do fleury
+    (um laço com quantidade c conta c no grau, ou seja, c // 2 laços) ou um CSRGraph não
+    direcionado.
+    """
+
+    def __init__(self, graph):
+        csr = CSRGraph.from_graph(graph)
+        self.graph = csr
+        n = csr.num_vertices
+        offsets, targets = csr.offsets, csr.targets
+
+        # Cada aresta não direcionada aparece nas duas linhas; fica com a ocorrência u < v
+        a, b = array('i'), array('i')
+        for u in range(n):
+            loops = 0
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if v > u:
+                    a.append(u)
+                    b.append(v)
+                elif v == u:
+                    loops += 1
+            for _ in range(loops // 2):
+                a.append(u)
+                b.append(u)
+        self.a, self.b = a, b
+        self.num_edges = m = len(a)
+
+        # Incidência vértice -> arestas por ordenação por contagem
+        inc_offsets = array('q', bytes(8 * (n + 1)))
+        for e in range(m):
+            inc_offsets[a[e] + 1] += 1
+            inc_offsets[b[e] + 1] += 1
+        for i in range(n):
+            inc_offsets[i + 1] += inc_offsets[i]
+        edges = array('i', bytes(4 * 2 * m))
+        pos = array('q', inc_offsets)
+        for e in range(m):
+            for u in (a[e], b[e]):
+                edges[pos[u]] = e
+                pos[u] += 1
+        self.offsets, self.edges = inc_offsets, edges
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+
+class LabelView(Mapping):
+    """
+    Visão somente leitura {rótulo: valor} sobre um array indexado por id, usada pelos modos
+    compactos das buscas. Nenhum dicionário é materializado: cada acesso converte o rótulo
+    em id e lê o array (disponível em .data). Posições iguais a `missing` devolvem `default`
+    e, com as_label=True, os valores (ids de predecessores) são devolvidos como rótulos.
+    """
+
+    def __init__(self, graph, data, missing=-1, default=None, as_label=False):
+        self.graph = graph
+        self.data = data
+        self.missing = missing
+        self.default = default
+        self.as_label = as_label
+
+    def __getitem__(self, label):
+        if label not in self.graph:
+            raise KeyError(label)
+        x = self.data[self.graph.id_of(label)]
+        if x == self.missing:
+            return self.default
+        return self.graph.label_of(x) if self.as_label else x
+
+    def __iter__(self):
+        return iter(self.graph.keys())
+
+    def __len__(self):
+        return self.graph.num_vertices
+
+    def to_dict(self):
+        """Materializa a visão em um dict com um único laço sobre o array."""
+        label, missing, default = self.graph.label_of, self.missing, self.default
+        if self.as_label:
+            return {label(i): (default if x == missing else label(x)) for i, x in enumerate(self.data)}
+        return {label(i): (default if x == missing else x) for i, x in enumerate(self.data)}
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+if __name__ == "__main__":
+    # Mesmo grafo do DFS, convertido para CSR
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['D'],
+        'C': ['D'],
+        'D': ['A'],
+        'E': ['F', 'G'],
+        'F': ['G'],
+        'G': [],
+        'H': []
+    }
+    g = CSRGraph.from_adjacency(grafo)
+    print(g)
+    print("offsets:", list(g.offsets))
+    print("targets:", list(g.targets))
+    for v in g:
+        print(f"  {v} → {g.get_neighbors(v)}")
+
+    # Grafo ponderado no formato do Bellman-Ford
+    g2 = CSRGraph.from_edges([0, 1, 2, 3], [(0, 1, 4), (0, 2, 5), (1, 2, -2), (2, 3, 3)])
+    print(g2, "arestas:", list(g2.edges()))
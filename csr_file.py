@@ -0,0 +1,279 @@
+"""
+    Nome da Tarefa: Arquivo binário de grafos CSR mapeado em memória
+
+    Descrição: Formato em disco para CSRGraph: um cabeçalho de 64 bytes seguido dos arrays
+    offsets (int64), targets (int32), weights (int64 ou float64, opcional) e da tabela de
+    rótulos, todos alinhados a 8 bytes e na ordem de bytes little-endian. open_csr mapeia o
+    arquivo com mmap e devolve um CSRGraph cujos arrays são memoryviews sobre as páginas
+    mapeadas: nada é lido ou copiado na abertura além do cabeçalho (e dos rótulos, se houver),
+    e bfs, bellman_ford e os DFS rodam direto sobre o arquivo. convert_edge_list gera o arquivo
+    a partir de uma lista de arestas em texto em duas passadas, contando graus e depois
+    espalhando as arestas no arquivo mapeado, sem guardar a lista de arestas em objetos Python.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from csr import CSRGraph, typecode_of
+
+MAGIC = b'GRAFCSR1'
+_HEADER = struct.Struct('<8sIIqqq24x')  # magic, flags, tipo dos rótulos, n, m, bytes dos rótulos
+
+# Bits de flags
+DIRECTED, WEIGHTED, FLOAT_WEIGHTS, ORDERED = 1, 2, 4, 8
+# Tipos da tabela de rótulos
+NO_LABELS, STR_LABELS, INT_LABELS = 0, 1, 2
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def _layout(n, m, weighted):
+    """Posições (em bytes) de offsets, targets, weights e rótulos no arquivo."""
+    offsets_at = _HEADER.size
+    targets_at = offsets_at + 8 * (n + 1)
+    weights_at = targets_at + _align(4 * m)
+    labels_at = weights_at + (8 * m if weighted else 0)
+    return offsets_at, targets_at, weights_at, labels_at
+
+
+def _check_byteorder():
+    if sys.byteorder != 'little':
+        raise OSError("O formato CSR em arquivo só é suportado em máquinas little-endian.")
+
+
+def _label_table(labels):
+    """(tipo, bytes) da tabela de rótulos: int64 por vértice ou offsets + UTF-8."""
+    if labels is None:
+        return NO_LABELS, b''
+    if all(type(label) is int for label in labels):
+        return INT_LABELS, array('q', labels).tobytes()
+    if all(isinstance(label, str) for label in labels):
+        encoded = [label.encode('utf-8') for label in labels]
+        offsets = array('q', [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return STR_LABELS, offsets.tobytes() + b''.join(encoded)
+    raise TypeError("Só rótulos int ou str podem ser gravados no arquivo CSR.")
+
+
+def save_csr(graph, path, ordered=True):
+    """
+    Grava um grafo (qualquer representação aceita por CSRGraph.from_graph) no arquivo path.
+    Com ordered=True grava o índice ordenado (CSRGraph.ordered), que os DFS usam direto do
+    arquivo sem reconstruí-lo.
+    """
+    _check_byteorder()
+    graph = CSRGraph.from_graph(graph)
+    if ordered:
+        graph = graph.ordered()
+    n, m = graph.num_vertices, len(graph.targets)
+    weights = graph.weights
+    kind, table = _label_table(graph.labels)
+
+    flags = DIRECTED if graph.directed else 0
+    if weights is not None:
+        flags |= WEIGHTED | (FLOAT_WEIGHTS if typecode_of(weights) == 'd' else 0)
+    if ordered:
+        flags |= ORDERED
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, flags, kind, n, m, len(table)))
+        file.write(memoryview(graph.offsets).cast('B'))
+        file.write(memoryview(graph.targets).cast('B'))
+        file.write(bytes(_align(4 * m) - 4 * m))
+        if weights is not None:
+            file.write(memoryview(weights).cast('B'))
+        file.write(table)
+
+
+def open_csr(path):
+    """
+    Abre um arquivo CSR sem copiar os arrays: devolve um CSRGraph cujos offsets, targets e
+    weights são memoryviews (somente leitura) sobre o arquivo mapeado. O mapeamento vive
+    enquanto o grafo existir.
+    """
+    _check_byteorder()
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, flags, kind, n, m, labels_size = _HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        mapping.close()
+        raise ValueError(f"'{path}' não é um arquivo CSR (assinatura {magic!r}).")
+
+    weighted = bool(flags & WEIGHTED)
+    offsets_at, targets_at, weights_at, labels_at = _layout(n, m, weighted)
+    view = memoryview(mapping)
+    offsets = view[offsets_at:targets_at].cast('q')
+    targets = view[targets_at:targets_at + 4 * m].cast('i')
+    weights = None
+    if weighted:
+        weights = view[weights_at:labels_at].cast('d' if flags & FLOAT_WEIGHTS else 'q')
+
+    labels = None
+    if kind == INT_LABELS:
+        labels = view[labels_at:labels_at + 8 * n].cast('q').tolist()
+    elif kind == STR_LABELS:
+        ends = view[labels_at:labels_at + 8 * (n + 1)].cast('q')
+        blob = mapping[labels_at + 8 * (n + 1):labels_at + labels_size]
+        labels = [blob[ends[i]:ends[i + 1]].decode('utf-8') for i in range(n)]
+
+    graph = CSRGraph(offsets, targets, weights, labels, directed=bool(flags & DIRECTED))
+    if flags & ORDERED:
+        graph._ordered = graph  # Já gravado como índice ordenado
+    graph._mapping = mapping
+    return graph
+
+
+def _parse_weight(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _edge_lines(path, comment):
+    """Campos de cada linha não vazia e sem comentário da lista de arestas."""
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            fields = line.split()
+            if fields and not fields[0].startswith(comment):
+                yield fields
+
+
+def convert_edge_list(text_path, csr_path, directed=True, integer_ids=True, ordered=True,
+                      comment='#'):
+    """
+    Converte uma lista de arestas em texto ("u v" ou "u v peso" por linha, linhas iniciadas
+    por comment ignoradas) para o formato CSR em arquivo, em duas passadas sobre o texto.
+
+    Com integer_ids=True os vértices são os inteiros 0..max (sem tabela de rótulos); senão
+    cada palavra é um rótulo e só o mapa rótulo -> id fica em memória (O(V)). Grafos não
+    direcionados guardam as duas direções, como CSRGraph.from_edges. Com ordered=True cada
+    linha é ordenada (e os rótulos seguem a ordem crescente), gerando o índice ordenado.
+    Retorna (número de vértices, número de arestas gravadas em targets).
+    """
+    _check_byteorder()
+
+    # Passada 1: graus de saída, número de arestas e tipo dos pesos
+    degree = array('q')
+    index = None if integer_ids else {}
+    weighted, integral = False, True
+    for fields in _edge_lines(text_path, comment):
+        if integer_ids:
+            u, v = int(fields[0]), int(fields[1])
+            if u < 0 or v < 0:
+                raise ValueError(f"Ids de vértices devem ser inteiros não negativos: {u}, {v}")
+            top = max(u, v)
+            if top >= len(degree):
+                degree.extend([0] * (top + 1 - len(degree)))
+        else:
+            u = index.setdefault(fields[0], len(index))
+            v = index.setdefault(fields[1], len(index))
+            if len(index) > len(degree):
+                degree.extend([0] * (len(index) - len(degree)))
+        if len(fields) > 2:
+            weighted = True
+            integral = integral and isinstance(_parse_weight(fields[2]), int)
+        degree[u] += 1
+        if not directed:
+            degree[v] += 1
+
+    n = len(degree)
+    labels = None
+    if not integer_ids:
+        labels = list(index)
+        if ordered:
+            # Ids na ordem crescente dos rótulos, como em CSRGraph.ordered
+            order = sorted(range(n), key=labels.__getitem__)
+            labels = [labels[i] for i in order]
+            degree = array('q', [degree[i] for i in order])
+        index = {label: i for i, label in enumerate(labels)}
+
+    m = sum(degree)
+    kind, table = _label_table(labels)
+    offsets_at, targets_at, weights_at, labels_at = _layout(n, m, weighted)
+    flags = (DIRECTED if directed else 0) | (ORDERED if ordered else 0)
+    if weighted:
+        flags |= WEIGHTED | (0 if integral else FLOAT_WEIGHTS)
+
+    with open(csr_path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, flags, kind, n, m, len(table)))
+        file.truncate(labels_at + len(table))
+    with open(csr_path, 'r+b') as file:
+        mapping = mmap.mmap(file.fileno(), 0)
+    view = memoryview(mapping)
+    offsets = view[offsets_at:targets_at].cast('q')
+    targets = view[targets_at:targets_at + 4 * m].cast('i')
+    weights = view[weights_at:labels_at].cast('q' if integral else 'd') if weighted else None
+    try:
+        total = 0
+        for u in range(n):
+            offsets[u] = total
+            total += degree[u]
+        offsets[n] = total
+        pos = degree  # Reaproveitado: próxima posição livre de cada linha
+        for u in range(n):
+            pos[u] = offsets[u]
+
+        # Passada 2: cada aresta vai direto para a sua posição no arquivo mapeado
+        for fields in _edge_lines(text_path, comment):
+            if integer_ids:
+                u, v = int(fields[0]), int(fields[1])
+            else:
+                u, v = index[fields[0]], index[fields[1]]
+            w = _parse_weight(fields[2]) if len(fields) > 2 else 1
+            for a, b in ((u, v),) if directed else ((u, v), (v, u)):
+                p = pos[a]
+                targets[p] = b
+                if weighted:
+                    weights[p] = w if integral else float(w)
+                pos[a] = p + 1
+
+        if ordered:
+            # Ordena cada linha (estável: arestas paralelas mantêm a ordem do texto)
+            for u in range(n):
+                a, b = offsets[u], offsets[u + 1]
+                if b - a < 2:
+                    continue
+                if weights is None:
+                    targets[a:b] = array('i', sorted(targets[a:b]))
+                else:
+                    row = sorted(zip(targets[a:b], weights[a:b]), key=lambda e: e[0])
+                    targets[a:b] = array('i', [t for t, _ in row])
+                    weights[a:b] = array(weights.format, [x for _, x in row])
+        mapping[labels_at:labels_at + len(table)] = table
+        mapping.flush()
+    finally:
+        for buffer in (offsets, targets, weights, view):
+            if buffer is not None:
+                buffer.release()
+        mapping.close()
+    return n, m
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from BFS import bfs
+    from DFS import DFS_Runner_List
+    from bellman_ford import bellman_ford
+
+    pasta = tempfile.mkdtemp()
+    texto = os.path.join(pasta, "arestas.txt")
+    with open(texto, 'w') as arquivo:
+        arquivo.write("# origem destino peso\nA B 4\nA C 5\nB C -2\nC D 3\nD E 1\n")
+
+    caminho = os.path.join(pasta, "grafo.csr")
+    print("Convertido:", convert_edge_list(texto, caminho, integer_ids=False), "(vértices, arestas)")
+    g = open_csr(caminho)
+    print(g, "- offsets mapeados:", list(g.offsets))
+
+    distancias, _ = bfs(g, 'A')
+    print("BFS a partir de A:", distancias)
+    print("Bellman-Ford a partir de A:", bellman_ford(g, 'A'))
+    print("Finalização no DFS:", DFS_Runner_List(g).run_dfs()["tempo_finalizacao"])
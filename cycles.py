@@ -0,0 +1,196 @@
+"""
+    Nome da Tarefa: Enumeração de ciclos elementares e base de ciclos
+
+    Descrição: simple_cycles gera todos os ciclos elementares de um grafo direcionado com o
+    algoritmo de Johnson (1975), sem recursão: para cada componente fortemente conexa, os
+    ciclos que passam pelo seu menor vértice s são enumerados com vértices bloqueados (um
+    vértice só volta a ser tentado depois que algum ciclo passa por ele), então s é retirado e
+    as componentes do restante são recalculadas. O custo é O((V + E)·(c + 1)) para c ciclos,
+    e cada ciclo é entregue assim que encontrado. Com max_length o bloqueio de Johnson deixa
+    de ser válido e a busca vira uma DFS limitada em profundidade nas mesmas componentes.
+
+    cycle_basis gera uma base de ciclos fundamentais de um grafo não direcionado: cada aresta
+    fora de uma floresta geradora (BFS) fecha um ciclo com o caminho da árvore entre as suas
+    pontas, reconstruído subindo pelos pais em tempo linear no tamanho do ciclo.
+"""
+
+from array import array
+from collections import deque
+
+from csr import CSRGraph, Multigraph
+from scc import scc_arrays
+
+
+def simple_cycles(graph, max_length=None):
+    """
+    Gera os ciclos elementares de um grafo direcionado como listas de rótulos, começando
+    pelo menor vértice do ciclo (na ordem do índice ordenado) e sem repetir o primeiro no
+    fim; laços aparecem como [v]. Arestas paralelas não geram ciclos repetidos.
+
+    Parâmetros:
+    graph : dict {vértice: [vizinhos]}, GraphAdjList ou CSRGraph
+    max_length : int
+        Se dado, só ciclos com no máximo max_length vértices
+    """
+    if max_length is not None and max_length < 1:
+        return
+    index = CSRGraph.from_graph(graph).ordered()
+    label = index.label_of
+    offsets, targets = index.offsets, index.targets
+
+    # Adjacência sem laços e sem repetições; os laços são ciclos de tamanho 1
+    succ = {}
+    for u in range(index.num_vertices):
+        row = sorted(set(targets[offsets[u]:offsets[u + 1]]))
+        if u in row:
+            yield [label(u)]
+            row.remove(u)
+        succ[u] = row
+
+    search = _johnson_search if max_length is None else _bounded_search
+    pending = _nontrivial_components(range(index.num_vertices), succ)
+    while pending:
+        component = pending.pop()
+        s = min(component)
+        members = set(component)
+        sub = {u: [v for v in succ[u] if v in members] for u in component}
+        for cycle in search(sub, s, max_length):
+            yield [label(v) for v in cycle]
+        members.discard(s)
+        pending.extend(_nontrivial_components(sorted(members), sub))
+
+
+def _nontrivial_components(vertices, succ):
+    """Componentes fortemente conexas com mais de um vértice do subgrafo induzido."""
+    vertices = list(vertices)
+    local = {v: i for i, v in enumerate(vertices)}
+    offsets, targets = array('q', [0]), array('i')
+    for v in vertices:
+        targets.extend(local[w] for w in succ[v] if w in local)
+        offsets.append(len(targets))
+    _, component, count = scc_arrays(CSRGraph(offsets, targets, None, None, directed=True))
+    groups = [[] for _ in range(count)]
+    for i, v in enumerate(vertices):
+        groups[component[i]].append(v)
+    return [group for group in reversed(groups) if len(group) > 1]
+
+
+def _johnson_search(sub, s, max_length=None):
+    """Ciclos pelo vértice s na componente sub (algoritmo de Johnson, iterativo)."""
+    path = [s]
+    blocked = {s}
+    block_map = {}           # B(w): vértices a desbloquear quando w for desbloqueado
+    closed = [False]         # closed[i]: algum ciclo passou por path[i] desde que entrou
+    stack = [iter(sub[s])]
+    while stack:
+        for w in stack[-1]:
+            if w == s:
+                yield list(path)
+                closed[-1] = True
+            elif w not in blocked:
+                path.append(w)
+                closed.append(False)
+                stack.append(iter(sub[w]))
+                blocked.add(w)
+                break
+        else:
+            stack.pop()
+            v = path.pop()
+            if closed.pop():
+                if closed:
+                    closed[-1] = True
+                # Desbloqueia v e, em cadeia, quem esperava por ele
+                unblock = [v]
+                while unblock:
+                    u = unblock.pop()
+                    if u in blocked:
+                        blocked.discard(u)
+                        unblock.extend(block_map.pop(u, ()))
+            else:
+                for w in sub[v]:
+                    block_map.setdefault(w, set()).add(v)
+
+
+def _bounded_search(sub, s, max_length):
+    """Ciclos pelo vértice s com no máximo max_length vértices (DFS limitada)."""
+    path = [s]
+    on_path = {s}
+    stack = [iter(sub[s])]
+    while stack:
+        for w in stack[-1]:
+            if w == s:
+                yield list(path)
+            elif w not in on_path and len(path) < max_length:
+                path.append(w)
+                on_path.add(w)
+                stack.append(iter(sub[w]))
+                break
+        else:
+            stack.pop()
+            on_path.discard(path.pop())
+
+
+def cycle_basis(graph):
+    """
+    Gera uma base de ciclos fundamentais de um grafo não direcionado (listas de rótulos,
+    cada uma fechada pela aresta entre o último e o primeiro vértice). São E - V + C ciclos,
+    com C o número de componentes conexas; laços aparecem como [v] e cada aresta paralela
+    extra como [u, v].
+
+    Parâmetros:
+    graph : CSRGraph não direcionado, GraphAdjList não direcionado, dicionário com as duas
+        direções de cada aresta ou {vértice: {vizinho: quantidade_arestas}} (fleury)
+    """
+    mg = Multigraph(CSRGraph.from_graph(graph).ordered())
+    label = mg.graph.label_of
+    a, b, offsets, edges = mg.a, mg.b, mg.offsets, mg.edges
+    n = mg.graph.num_vertices
+
+    # Floresta geradora por BFS: aresta da árvore e profundidade de cada vértice
+    parent_edge = array('i', [-1]) * n
+    depth = array('i', [-1]) * n
+    for r in range(n):
+        if depth[r] >= 0:
+            continue
+        depth[r] = 0
+        queue = deque([r])
+        while queue:
+            u = queue.popleft()
+            for e in edges[offsets[u]:offsets[u + 1]]:
+                v = a[e] ^ b[e] ^ u
+                if depth[v] < 0:
+                    depth[v] = depth[u] + 1
+                    parent_edge[v] = e
+                    queue.append(v)
+
+    for e in range(mg.num_edges):
+        u, v = a[e], b[e]
+        if parent_edge[v] == e or parent_edge[u] == e:
+            continue  # Aresta da árvore
+        # Sobe das duas pontas até o ancestral comum
+        left, right = [u], [v]
+        while u != v:
+            if depth[u] >= depth[v]:
+                u = a[parent_edge[u]] ^ b[parent_edge[u]] ^ u
+                left.append(u)
+            else:
+                v = a[parent_edge[v]] ^ b[parent_edge[v]] ^ v
+                right.append(v)
+        right.pop()  # O ancestral comum já está no fim de left
+        right.reverse()
+        yield [label(x) for x in left + right]
+
+
+if __name__ == "__main__":
+    dependencias = {
+        'A': ['B'],
+        'B': ['C', 'D'],
+        'C': ['A'],
+        'D': ['A', 'D'],
+    }
+    print("Ciclos elementares:", list(simple_cycles(dependencias)))
+    print("Ciclos com até 2 vértices:", list(simple_cycles(dependencias, max_length=2)))
+
+    # Dois quadrados com um lado em comum: base com 2 ciclos
+    grade = {1: [2, 4], 2: [1, 3, 5], 3: [2, 6], 4: [1, 5], 5: [2, 4, 6], 6: [3, 5]}
+    print("Base de ciclos:", list(cycle_basis(grade)))
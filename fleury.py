@@ -1,53 +1,139 @@
-def fleury(graph, start):
+from array import array
+from collections import Counter
+
+from bridges import BridgeIndex
+from csr import CSRGraph, Multigraph
+
+
+def check_eulerian(graph, start=None):
+    """
+    Verificação prévia, em uma única passada O(V + E), de que o grafo admite um ciclo ou
+    um caminho Euleriano, antes de qualquer execução cara.
+
+    - 0 vértices de grau ímpar: ciclo Euleriano; sem start, começa no primeiro vértice com
+      arestas.
+    - 2 vértices de grau ímpar: caminho Euleriano; sem start, começa no primeiro deles (um
+      start informado precisa ser um dos dois).
+    - Todas as arestas precisam estar em uma única componente conexa.
+
+    Retorna o id do vértice inicial no Multigraph ou lança ValueError com o motivo.
+    """
+    multigraph = graph if isinstance(graph, Multigraph) else Multigraph(graph)
+    csr = multigraph.graph
+    n = csr.num_vertices
+    a, b = multigraph.a, multigraph.b
+    offsets, edges = multigraph.offsets, multigraph.edges
+
+    if n == 0:
+        raise ValueError("Grafo vazio: não há vértice inicial.")
+
+    odd = [u for u in range(n) if multigraph.degree(u) % 2 != 0]
+    if len(odd) not in (0, 2):
+        names = ", ".join(f"'{csr.label_of(u)}'" for u in odd[:5])
+        raise ValueError(f"Grafo não Euleriano: {len(odd)} vértices têm grau ímpar ({names}"
+                         f"{', ...' if len(odd) > 5 else ''}); são permitidos 0 (ciclo) ou 2 (caminho).")
+
+    if start is not None:
+        s = csr.id_of(start)
+        if odd and s not in odd:
+            raise ValueError(f"Grafo não Euleriano a partir de '{start}': o caminho Euleriano deve "
+                             f"começar em um vértice de grau ímpar ('{csr.label_of(odd[0])}' ou "
+                             f"'{csr.label_of(odd[1])}').")
+        if multigraph.num_edges and multigraph.degree(s) == 0:
+            raise ValueError(f"Grafo não Euleriano a partir de '{start}': o vértice não tem arestas.")
+    elif odd:
+        s = odd[0]
+    else:
+        s = next((u for u in range(n) if multigraph.degree(u) > 0), 0)
+
+    # Conectividade: todo vértice com arestas precisa ser alcançável a partir de s
+    seen = bytearray(n)
+    seen[s] = 1
+    stack = [s]
+    while stack:
+        u = stack.pop()
+        for e in edges[offsets[u]:offsets[u + 1]]:
+            v = a[e] ^ b[e] ^ u
+            if not seen[v]:
+                seen[v] = 1
+                stack.append(v)
+    for u in range(n):
+        if not seen[u] and multigraph.degree(u) > 0:
+            raise ValueError(f"Grafo não Euleriano: a aresta em '{csr.label_of(u)}' está em uma componente"
+                             f" conexa diferente da de '{csr.label_of(s)}'.")
+
+    return s
+
+
+def hierholzer(graph, start=None):
+    """
+    Encontra um ciclo (ou caminho) Euleriano com o algoritmo de Hierholzer em O(V + E).
+
+    Cada vértice mantém um cursor para a próxima aresta incidente ainda não examinada e
+    cada aresta é marcada como usada uma única vez, então nenhuma verificação de ponte é
+    necessária. Mesma entrada e mesmo retorno de fleury (o ciclo pode ser outro, igualmente
+    válido); a validação e a escolha do início são as de check_eulerian.
+    """
+    multigraph = graph if isinstance(graph, Multigraph) else Multigraph(graph)
+    csr = multigraph.graph
+    a, b = multigraph.a, multigraph.b
+    offsets, edges = multigraph.offsets, multigraph.edges
+
+    s = check_eulerian(multigraph, start)
+    cursor = array('q', offsets[:-1])
+    used = bytearray(multigraph.num_edges)
+    stack = [s]
+    circuit = []
+
+    while stack:
+        u = stack[-1]
+        k, end = cursor[u], offsets[u + 1]
+        while k < end and used[edges[k]]:
+            k += 1
+        if k == end:
+            cursor[u] = k
+            circuit.append(stack.pop())  # Sem arestas livres: u entra no circuito
+        else:
+            e = edges[k]
+            cursor[u] = k + 1
+            used[e] = 1
+            stack.append(a[e] ^ b[e] ^ u)
+
+    circuit.reverse()
+    return [csr.label_of(u) for u in circuit]
+
+
+def fleury(graph, start=None):
     """
     Implementa o algoritmo de Fleury para encontrar um ciclo Euleriano em um grafo não direcionado.
+    Com exatamente dois vértices de grau ímpar encontra um caminho Euleriano entre eles.
 
     Parâmetros:
-    - graph (dict): Dicionário de adjacência. Formato: {vértice: {vizinho: quantidade_arestas}}
-    - start (hashable): Vértice inicial do ciclo.
+    - graph (dict | CSRGraph): Dicionário de adjacência no formato {vértice: {vizinho: quantidade_arestas}},
+      ou um CSRGraph não direcionado (arestas paralelas repetidas em targets).
+    - start (hashable): Vértice inicial do ciclo. Se omitido, é escolhido automaticamente
+      (um vértice de grau ímpar no caso do caminho).
 
     Retorna:
     - list: Lista com o caminho do ciclo Euleriano.
+
+    Antes de qualquer passo, check_eulerian valida graus e conectividade em O(V + E) e lança
+    ValueError com o motivo se o grafo não for Euleriano.
     """
 
-    # Função auxiliar que verifica se a aresta (u, v) é uma ponte
-    def is_bridge(u, v):
-        # Se há múltiplas arestas, não pode ser ponte
-        if graph[u][v] > 1:
-            return False
-
-        # Remove temporariamente a aresta
-        original = graph[u][v]
-        graph[u][v] -= 1
-        graph[v][u] -= 1
-
-        # Verifica conectividade com DFS
-        visited = set()
-        stack = [u]
-        while stack:
-            node = stack.pop()
-            if node not in visited:
-                visited.add(node)
-                for neighbor, count in graph[node].items():
-                    if count > 0 and neighbor not in visited:
-                        stack.append(neighbor)
-
-        # Restaura a aresta
-        graph[u][v] += 1
-        graph[v][u] += 1
-
-        # Se 'v' ficou inacessível, a aresta é ponte
-        return v not in visited
-
-    # Cria cópia segura do grafo
-    from copy import deepcopy
-    graph = deepcopy(graph)
-
-    # Verifica graus pares para todos os vértices
-    for node in graph:
-        grau = sum(graph[node].values())
-        if grau % 2 != 0:
-            raise ValueError(f"Grafo não Euleriano: vértice '{node}' tem grau ímpar.")
+    # Verifica graus e conectividade e escolhe o vértice inicial (antes de copiar o grafo)
+    multigraph = Multigraph(graph)
+    start = multigraph.graph.label_of(check_eulerian(multigraph, start))
+
+    # Índice de pontes: "(u, v) é ponte?" em O(1), atualizado a cada aresta removida
+    bridges = BridgeIndex(multigraph)
+
+    # Cria cópia segura do grafo (o CSRGraph é expandido direto para o formato de contagens)
+    if isinstance(graph, CSRGraph):
+        graph = {v: dict(Counter(graph.get_neighbors(v))) for v in graph}
+    else:
+        from copy import deepcopy
+        graph = deepcopy(graph)
 
     # Inicializa estruturas
     path = [start]
@@ -67,7 +153,7 @@ def fleury(graph, start):
         else:
             # Prefere arestas que não são pontes
             for v in neighbors:
-                if not is_bridge(current, v):
+                if not bridges.is_bridge(current, v):
                     next_vertex = v
                     break
             else:
@@ -77,6 +163,7 @@ def fleury(graph, start):
         path.append(next_vertex)
         graph[current][next_vertex] -= 1
         graph[next_vertex][current] -= 1
+        bridges.remove_edge(current, next_vertex)
         current = next_vertex
 
     return path
@@ -98,14 +185,28 @@ if __name__ == "__main__":
         'B': {'A': 2}
     }
     print("Arestas Paralelas:", fleury(grafo_paralelo, 'A'))  # Ex: ['A','B','A']
+    print("Arestas Paralelas (Hierholzer):", hierholzer(grafo_paralelo, 'A'))
 
-    # Exemplo 3: Grafo inválido (graus ímpares)
+    # Exemplo 3: Caminho Euleriano (dois vértices de grau ímpar)
     grafo_estrela = {
         'A': {'B': 1, 'C': 1},
         'B': {'A': 1},
         'C': {'A': 1}
     }
+    print("Estrela:", fleury(grafo_estrela))  # Ex: ['B','A','C']
+    try:
+        print("Estrela a partir de A:", fleury(grafo_estrela, 'A'))
+    except ValueError as e:
+        print("Estrela a partir de A:", e)  # Erro esperado
+
+    # Exemplo 4: Grafo inválido (arestas em duas componentes)
+    grafo_desconexo = {
+        'A': {'B': 2},
+        'B': {'A': 2},
+        'C': {'D': 2},
+        'D': {'C': 2}
+    }
     try:
-        print("Estrela:", fleury(grafo_estrela, 'A'))
+        print("Desconexo:", fleury(grafo_desconexo, 'A'))
     except ValueError as e:
-        print("Estrela:", e)  # Erro esperado
\ No newline at end of file
+        print("Desconexo:", e)  # Erro esperado
\ No newline at end of file
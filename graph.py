@@ -1,30 +1,135 @@
-import matplotlib.pyplot as plt
-import networkx as nx
+from array import array
+
+from visualization import draw_graph
 
 
 class GraphMatrix:
-    """Representação de grafo usando matriz de adjacências"""
+    """
+    Representação de grafo usando matriz de adjacências.
+
+    Cada linha da matriz é um conjunto de bits (1 bit por vértice) dentro de um único
+    bytearray, 64× menor que uma lista de ints, e os graus ficam em cache, atualizados em
+    add_edge. Interseções de linhas (vizinhos em comum, triângulos) são feitas com operações
+    bit a bit sobre inteiros do Python, em C, uma palavra de 64 vértices por vez.
 
-    def __init__(self, num_vertices):
+    log é uma função chamada com as mensagens de criação e de cada aresta (por exemplo,
+    print); o padrão None não registra nada.
+    """
+
+    def __init__(self, num_vertices, log=None):
         self.num_vertices = num_vertices
-        self.matrix = [[0] * num_vertices for _ in range(num_vertices)]
-        print(f"\n🔷 Grafo com Matriz de Adjacências criado ({num_vertices} vértices)")
+        self.stride = (num_vertices + 7) // 8  # Bytes por linha
+        self.bits = bytearray(self.stride * num_vertices)
+        self.degrees = array('q', bytes(8 * num_vertices))
+        self.log = log
+        if log is not None:
+            log(f"\n🔷 Grafo com Matriz de Adjacências criado ({num_vertices} vértices)")
+
+    @classmethod
+    def from_edge_array(cls, sources, targets, num_vertices=None, log=None):
+        """
+        Cria o grafo a partir de dois arrays (ou listas) de pontas, na mesma ordem de
+        argumentos de GraphAdjList.from_edge_array. Sem num_vertices, o grafo tem os
+        vértices 0..maior ponta
+        """
+        if num_vertices is None:
+            num_vertices = _vertex_count(sources, targets)
+        graph = cls(num_vertices, log)
+        graph.add_edges(_zip_edges(sources, targets))
+        return graph
 
     def add_edge(self, u, v):
-        """Adiciona uma aresta entre dois vértices (não direcionado)"""
-        if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
-            self.matrix[u][v] = 1
-            self.matrix[v][u] = 1
-            print(f"   ➕ Aresta adicionada: ({u} ↔ {v})")
+        """Adiciona uma aresta entre dois vértices (não direcionado); ValueError se inválidos"""
+        if not (0 <= u < self.num_vertices and 0 <= v < self.num_vertices):
+            raise ValueError(f"Vértices inválidos ({u} ou {v})")
+        if not self.has_edge(u, v):
+            self.bits[u * self.stride + (v >> 3)] |= 1 << (v & 7)
+            self.bits[v * self.stride + (u >> 3)] |= 1 << (u & 7)
+            self.degrees[u] += 1
+            if u != v:
+                self.degrees[v] += 1
+        if self.log is not None:
+            self.log(f"   ➕ Aresta adicionada: ({u} ↔ {v})")
+
+    def add_edges(self, edges):
+        """
+        Adiciona um lote de arestas (pares (u, v) ou array m × 2). O lote inteiro é validado
+        antes de qualquer inserção: um vértice inválido gera ValueError e nada é adicionado.
+        """
+        np = _numpy()
+        us, vs = _edge_batch(edges, self.num_vertices)
+        stride = self.stride
+        if np is not None:
+            # Pares únicos (menor, maior) que ainda não estão na matriz
+            keys = np.unique(np.minimum(us, vs) * self.num_vertices + np.maximum(us, vs))
+            a, b = np.divmod(keys, self.num_vertices)
+            bits = np.frombuffer(self.bits, dtype=np.uint8)
+            new = (bits[a * stride + (b >> 3)] >> (b & 7) & 1) == 0
+            a, b = a[new], b[new]
+            np.bitwise_or.at(bits, a * stride + (b >> 3), (1 << (b & 7)).astype(np.uint8))
+            np.bitwise_or.at(bits, b * stride + (a >> 3), (1 << (a & 7)).astype(np.uint8))
+            degrees = np.frombuffer(self.degrees, dtype=np.int64)
+            degrees += np.bincount(a, minlength=self.num_vertices)
+            degrees += np.bincount(b[a != b], minlength=self.num_vertices)
+            added = len(a)
         else:
-            print(f"   ⚠️ Erro: Vértices inválidos ({u} ou {v})")
+            bits, degrees, added = self.bits, self.degrees, 0
+            for u, v in zip(us, vs):
+                i = u * stride + (v >> 3)
+                if not bits[i] >> (v & 7) & 1:
+                    bits[i] |= 1 << (v & 7)
+                    bits[v * stride + (u >> 3)] |= 1 << (u & 7)
+                    degrees[u] += 1
+                    if u != v:
+                        degrees[v] += 1
+                    added += 1
+        if self.log is not None:
+            self.log(f"   ➕ {added} arestas adicionadas (lote de {len(us)})")
+
+    def has_edge(self, u, v):
+        """Verifica se existe aresta entre u e v, em O(1)"""
+        return bool(self.bits[u * self.stride + (v >> 3)] >> (v & 7) & 1)
 
     def vertex_degree(self, v):
-        """Calcula o grau do vértice (número de conexões)"""
+        """Retorna o grau do vértice (número de conexões), em O(1)"""
         if 0 <= v < self.num_vertices:
-            return sum(self.matrix[v])
+            return self.degrees[v]
         return -1
 
+    def row_bits(self, v):
+        """Linha v como inteiro: o bit j está ligado se existe a aresta (v, j)"""
+        return int.from_bytes(self.bits[v * self.stride:(v + 1) * self.stride], 'little')
+
+    def neighbors(self, v):
+        """Vizinhos de v em ordem crescente"""
+        return _bit_indices(self.row_bits(v))
+
+    def common_neighbors(self, u, v):
+        """Vizinhos em comum de u e v (sem contar os próprios u e v)"""
+        return _bit_indices(self._common(u, v))
+
+    def count_common_neighbors(self, u, v):
+        """Número de vizinhos em comum de u e v (sem contar os próprios u e v)"""
+        return self._common(u, v).bit_count()
+
+    def triangles(self, v):
+        """Número de triângulos que passam pelo vértice v"""
+        total = sum(self._common(u, v).bit_count() for u in self.neighbors(v) if u != v)
+        return total // 2  # Cada triângulo (v, u, w) aparece por u e por w
+
+    def count_triangles(self):
+        """Número de triângulos do grafo"""
+        return sum(self.triangles(v) for v in range(self.num_vertices)) // 3
+
+    def _common(self, u, v):
+        return self.row_bits(u) & self.row_bits(v) & ~(1 << u) & ~(1 << v)
+
+    @property
+    def matrix(self):
+        """Cópia da matriz como lista de listas de 0/1 (compatibilidade; custa O(n²))"""
+        n = self.num_vertices
+        return [[int(self.has_edge(i, j)) for j in range(n)] for i in range(n)]
+
     def display(self):
         """Exibe a matriz de forma visual"""
         print("\nMATRIZ DE ADJACÊNCIAS:")
@@ -33,40 +138,150 @@ class GraphMatrix:
             print(f"{i} | {' '.join('●' if x else '○' for x in row)} |")
         print("Legenda: ● = conexão, ○ = sem conexão")
 
-    def visualize(self):
-        """Mostra uma representação gráfica do grafo"""
-        G = nx.Graph()
-        G.add_nodes_from(range(self.num_vertices))
-        for i in range(self.num_vertices):
-            for j in range(i + 1, self.num_vertices):
-                if self.matrix[i][j]:
-                    G.add_edge(i, j)
+    def visualize(self, path=None, max_nodes=300, large_mode='sample', label_limit=None):
+        """
+        Mostra uma representação gráfica do grafo, com todos os vértices (inclusive os
+        isolados); com path, grava a figura em arquivo sem interface gráfica. Grafos grandes
+        são amostrados ou agregados e label_limit limita os rótulos (ver visualization)
+        """
+        draw_graph(self.num_vertices, self.neighbors, "Representação do Grafo (Matriz)",
+                   layout='circular', node_color='#ff7979', edge_color='#5352ed',
+                   path=path, max_nodes=max_nodes, large_mode=large_mode,
+                   label_limit=label_limit)
 
-        plt.figure(figsize=(7, 6))
-        plt.title("Representação do Grafo (Matriz)", fontsize=14)
-        pos = nx.circular_layout(G)
-        nx.draw(G, pos, with_labels=True, node_size=800,
-                node_color='#ff7979', edge_color='#5352ed',
-                width=2, font_weight='bold')
-        plt.show()
+
+def _numpy():
+    """
+    NumPy, importado só na primeira carga em lote para não pesar no import deste módulo;
+    None se não estiver instalado (a carga em lote usa laços simples)
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _zip_edges(sources, targets):
+    """Junta dois arrays de pontas em pares de arestas"""
+    np = _numpy()
+    if np is not None:
+        return np.column_stack((np.asarray(sources), np.asarray(targets)))
+    return list(zip(sources, targets))
+
+
+def _vertex_count(sources, targets):
+    """Número de vértices implícito em dois arrays de pontas: maior ponta + 1"""
+    np = _numpy()
+    if np is not None:
+        ends = np.concatenate((np.ravel(sources), np.ravel(targets)))
+        return int(ends.max()) + 1 if ends.size else 0
+    return max(max(sources, default=-1), max(targets, default=-1)) + 1
+
+
+def _edge_batch(edges, num_vertices):
+    """
+    Converte um lote de arestas em dois arrays de pontas (ndarray int64 com NumPy,
+    array('q') sem ele) e valida todos os vértices de uma vez.
+    """
+    np = _numpy()
+    if np is not None:
+        pairs = np.asarray(edges if isinstance(edges, np.ndarray) else list(edges))
+        if pairs.size == 0:
+            pairs = np.empty((0, 2), dtype=np.int64)
+        if pairs.ndim != 2 or pairs.shape[1] != 2 or not np.issubdtype(pairs.dtype, np.integer):
+            raise ValueError("As arestas devem ser pares (u, v) de vértices inteiros.")
+        pairs = pairs.astype(np.int64, copy=False)
+        invalid = ((pairs < 0) | (pairs >= num_vertices)).any(axis=1)
+        if invalid.any():
+            u, v = pairs[invalid.argmax()].tolist()
+            raise ValueError(f"Vértices inválidos ({u} ou {v})")
+        return pairs[:, 0], pairs[:, 1]
+
+    us, vs = array('q'), array('q')
+    for u, v in edges:
+        us.append(u)
+        vs.append(v)
+    if us and (min(us) < 0 or min(vs) < 0 or max(us) >= num_vertices or max(vs) >= num_vertices):
+        u, v = next((u, v) for u, v in zip(us, vs)
+                    if not (0 <= u < num_vertices and 0 <= v < num_vertices))
+        raise ValueError(f"Vértices inválidos ({u} ou {v})")
+    return us, vs
+
+
+def _bit_indices(x):
+    """Posições dos bits ligados de x, em ordem crescente"""
+    digits = format(x, 'b')[::-1]  # digits[j] é o bit j
+    result = []
+    j = digits.find('1')
+    while j >= 0:
+        result.append(j)
+        j = digits.find('1', j + 1)
+    return result
 
 
 class GraphList:
-    """Representação de grafo usando lista de adjacências"""
+    """
+    Representação de grafo usando lista de adjacências.
+
+    log é uma função chamada com as mensagens de criação e de cada aresta (por exemplo,
+    print); o padrão None não registra nada.
+    """
 
-    def __init__(self, num_vertices):
+    def __init__(self, num_vertices, log=None):
         self.num_vertices = num_vertices
         self.adj_list = [[] for _ in range(num_vertices)]
-        print(f"\n🔶 Grafo com Lista de Adjacências criado ({num_vertices} vértices)")
+        self.log = log
+        if log is not None:
+            log(f"\n🔶 Grafo com Lista de Adjacências criado ({num_vertices} vértices)")
+
+    @classmethod
+    def from_edge_array(cls, sources, targets, num_vertices=None, log=None):
+        """
+        Cria o grafo a partir de dois arrays (ou listas) de pontas, na mesma ordem de
+        argumentos de GraphAdjList.from_edge_array. Sem num_vertices, o grafo tem os
+        vértices 0..maior ponta
+        """
+        if num_vertices is None:
+            num_vertices = _vertex_count(sources, targets)
+        graph = cls(num_vertices, log)
+        graph.add_edges(_zip_edges(sources, targets))
+        return graph
 
     def add_edge(self, u, v):
-        """Adiciona uma aresta entre dois vértices (não direcionado)"""
-        if 0 <= u < self.num_vertices and 0 <= v < self.num_vertices:
-            self.adj_list[u].append(v)
-            self.adj_list[v].append(u)
-            print(f"   ➕ Aresta adicionada: ({u} ↔ {v})")
+        """Adiciona uma aresta entre dois vértices (não direcionado); ValueError se inválidos"""
+        if not (0 <= u < self.num_vertices and 0 <= v < self.num_vertices):
+            raise ValueError(f"Vértices inválidos ({u} ou {v})")
+        self.adj_list[u].append(v)
+        self.adj_list[v].append(u)
+        if self.log is not None:
+            self.log(f"   ➕ Aresta adicionada: ({u} ↔ {v})")
+
+    def add_edges(self, edges):
+        """
+        Adiciona um lote de arestas (pares (u, v) ou array m × 2), com o mesmo resultado de
+        chamar add_edge para cada uma, em ordem. O lote inteiro é validado antes: um vértice
+        inválido gera ValueError e nada é adicionado.
+        """
+        np = _numpy()
+        us, vs = _edge_batch(edges, self.num_vertices)
+        adj = self.adj_list
+        if np is not None and len(us):
+            # Sequência (u0, v0), (v0, u0), (u1, v1), ... ordenada de forma estável pela
+            # origem: cada lista recebe os seus vizinhos na ordem original, com um extend só
+            sources = np.column_stack((us, vs)).ravel()
+            targets = np.column_stack((vs, us)).ravel()
+            order = np.argsort(sources, kind='stable')
+            sources, targets = sources[order], targets[order].tolist()
+            starts = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]]).tolist()
+            for start, end, u in zip(starts, starts[1:] + [len(targets)], sources[starts].tolist()):
+                adj[u].extend(targets[start:end])
         else:
-            print(f"   ⚠️ Erro: Vértices inválidos ({u} ou {v})")
+            for u, v in zip(us, vs):
+                adj[u].append(v)
+                adj[v].append(u)
+        if self.log is not None:
+            self.log(f"   ➕ {len(us)} arestas adicionadas")
 
     def vertex_degree(self, v):
         """Calcula o grau do vértice (número de conexões)"""
@@ -80,21 +295,16 @@ class GraphList:
         for i, neighbors in enumerate(self.adj_list):
             print(f"Vértice {i}: → {' → '.join(map(str, neighbors))}" if neighbors else f"Vértice {i}: → Ø")
 
-    def visualize(self):
-        """Mostra uma representação gráfica do grafo"""
-        G = nx.Graph()
-        for i in range(self.num_vertices):
-            for neighbor in self.adj_list[i]:
-                if i < neighbor:
-                    G.add_edge(i, neighbor)
-
-        plt.figure(figsize=(7, 6))
-        plt.title("Representação do Grafo (Lista)", fontsize=14)
-        pos = nx.spring_layout(G, seed=42)
-        nx.draw(G, pos, with_labels=True, node_size=800,
-                node_color='#7bed9f', edge_color='#ff6b81',
-                width=2, font_weight='bold')
-        plt.show()
+    def visualize(self, path=None, max_nodes=300, large_mode='sample', label_limit=None):
+        """
+        Mostra uma representação gráfica do grafo, só com os vértices que têm arestas; com
+        path, grava a figura em arquivo sem interface gráfica. Grafos grandes são amostrados
+        ou agregados e label_limit limita os rótulos (ver visualization)
+        """
+        draw_graph(self.num_vertices, self.adj_list.__getitem__, "Representação do Grafo (Lista)",
+                   layout='spring', node_color='#7bed9f', edge_color='#ff6b81',
+                   path=path, max_nodes=max_nodes, large_mode=large_mode,
+                   isolated=False, label_limit=label_limit)
 
 
 # Demonstração
@@ -104,8 +314,8 @@ if __name__ == "__main__":
     print("=" * 55)
 
     # Criar estruturas
-    gm = GraphMatrix(4)
-    gl = GraphList(4)
+    gm = GraphMatrix(4, log=print)
+    gl = GraphList(4, log=print)
 
     # Adicionar conexões
     conexoes = [(0, 1), (0, 2), (1, 2), (2, 3)]
@@ -125,6 +335,7 @@ if __name__ == "__main__":
     print(" GRAUS DOS VÉRTICES ".center(25, '■'))
     for v in range(4):
         print(f" Vértice {v}: Matriz = {gm.vertex_degree(v)} | Lista = {gl.vertex_degree(v)}")
+    print(f" Triângulos: {gm.count_triangles()} | Vizinhos comuns de 0 e 1: {gm.common_neighbors(0, 1)}")
 
     # Gerar visualizações
     print("\n" + "=" * 55)
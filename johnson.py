@@ -0,0 +1,215 @@
+"""
+    Nome da Tarefa: Caminhos mínimos entre todos os pares (Johnson)
+
+    Descrição: Usa o Bellman-Ford uma única vez, a partir de um vértice virtual ligado a todos
+    os outros com peso 0, para obter potenciais h que tornam todos os pesos não negativos
+    (w'(u, v) = w(u, v) + h[u] - h[v]). Em seguida roda Dijkstra a partir de cada vértice,
+    distribuindo as fontes entre processos que leem os arrays de arestas em memória
+    compartilhada e escrevem as linhas diretamente em uma matriz de distâncias mapeada em
+    arquivo (float64, n × n, por linhas).
+"""
+
+import ctypes
+import heapq
+import mmap
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from bellman_ford import bellman_ford_result
+from csr import CSRGraph, typecode_of
+
+# Estado de cada processo trabalhador (preenchido por _inicializa_trabalhador)
+_trabalhador = {}
+
+
+def _potenciais(grafo):
+    """Bellman-Ford (modo fila) a partir de um vértice virtual n ligado a todos com peso 0."""
+    n = grafo.num_vertices
+    offsets = array('q', grafo.offsets)
+    offsets.append(offsets[-1] + n)
+    targets = array('i', grafo.targets)
+    targets.extend(range(n))
+    pesos = grafo.weights if grafo.weights is not None else array('q', [1]) * len(grafo.targets)
+    weights = array(typecode_of(pesos), pesos)
+    weights.extend([0] * n)
+
+    aumentado = CSRGraph(offsets, targets, weights, None, directed=True)
+    resultado = bellman_ford_result(aumentado, n, modo='fila')
+    if resultado.negative_cycle is not None:
+        return None, [grafo.label_of(v) for v in resultado.negative_cycle]
+    return resultado.dist.data[:n], None
+
+
+def _compartilha(dados, typecode):
+    """Copia um array para um bloco de memória compartilhada e devolve o bloco."""
+    dados = array(typecode, dados)
+    bloco = shared_memory.SharedMemory(create=True, size=max(1, len(dados) * dados.itemsize))
+    bloco.buf[:len(dados) * dados.itemsize] = dados.tobytes()
+    return bloco
+
+
+def _inicializa_trabalhador(n, m, nomes, saida):
+    """Anexa os blocos compartilhados e o arquivo de saída uma única vez por processo."""
+    blocos = [shared_memory.SharedMemory(name=nome) for nome in nomes]
+    offsets = blocos[0].buf[:8 * (n + 1)].cast('q')
+    targets = blocos[1].buf[:4 * m].cast('i')
+    pesos = blocos[2].buf[:8 * m].cast('d')
+    h = blocos[3].buf[:8 * n].cast('d')
+    mapa = matriz = None
+    if n:
+        with open(saida, 'r+b') as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 8 * n * n)
+        matriz = memoryview(mapa).cast('d')
+    _trabalhador.update(n=n, blocos=blocos, offsets=offsets, targets=targets,
+                        pesos=pesos, h=h, mapa=mapa, matriz=matriz)
+
+
+def _dijkstra_intervalo(inicio, fim):
+    """Roda Dijkstra (pesos reponderados) para as fontes inicio..fim-1 e grava as linhas."""
+    t = _trabalhador
+    n, offsets, targets, pesos, h, matriz = (
+        t['n'], t['offsets'], t['targets'], t['pesos'], t['h'], t['matriz'])
+    inf = float('inf')
+
+    for s in range(inicio, fim):
+        dist = [inf] * n
+        dist[s] = 0.0
+        heap = [(0.0, s)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            a, b = offsets[u], offsets[u + 1]
+            for v, peso in zip(targets[a:b], pesos[a:b]):
+                nd = d + peso
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+
+        # Desfaz a reponderação: dist(s, v) = dist'(s, v) - h[s] + h[v]
+        hs = h[s]
+        linha = array('d', (dv - hs + h[v] if dv != inf else inf for v, dv in enumerate(dist)))
+        matriz[s * n:(s + 1) * n] = linha
+    return fim - inicio
+
+
+def _finaliza_trabalhador():
+    t = _trabalhador
+    for nome in ('offsets', 'targets', 'pesos', 'h', 'matriz'):
+        if t.get(nome) is not None:
+            t[nome].release()
+    if t.get('mapa') is not None:
+        t['mapa'].close()
+    for bloco in t.get('blocos', []):
+        bloco.close()
+    t.clear()
+
+
+def johnson(grafo, saida=None, processos=None):
+    """
+    Distâncias mínimas entre todos os pares de um CSRGraph ponderado (pesos negativos
+    permitidos). Para listas de vértices e arestas use CSRGraph.from_edges(vertices, arestas).
+
+    Parâmetros:
+    - grafo (CSRGraph): grafo direcionado ponderado.
+    - saida (str): arquivo onde a matriz n × n (float64, por linhas) é gravada e que fica
+      com quem chamou; se None, um arquivo temporário é criado e removido logo depois de
+      mapeado (o mapeamento continua válido até a matriz ser liberada).
+    - processos (int): número de processos; None usa todos os núcleos, 1 roda no próprio
+      processo.
+
+    Retorna:
+    - memoryview: matriz no formato 'd' com shape (n, n), mapeada sobre o arquivo de saída
+      (matriz[i, j] é a distância do id i ao id j, inf se inalcançável; np.asarray a usa
+      sem cópia). Retorna None se houver ciclo negativo.
+    """
+    n, m = grafo.num_vertices, len(grafo.targets)
+
+    h, ciclo = _potenciais(grafo)
+    if ciclo is not None:
+        print("O grafo contém ciclo negativo!")
+        return None
+
+    # Pesos reponderados (não negativos) calculados uma vez no processo principal
+    pesos = grafo.weights if grafo.weights is not None else array('q', [1]) * m
+    offsets, targets = grafo.offsets, grafo.targets
+    reponderados = array('d', bytes(8 * m))
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            reponderados[k] = max(0.0, pesos[k] + h[u] - h[targets[k]])
+
+    temporario = saida is None
+    if temporario:
+        descritor, saida = tempfile.mkstemp(suffix='.dist')
+        os.close(descritor)
+    try:
+        return _calcula_matriz(n, m, offsets, targets, reponderados, h, saida, processos)
+    finally:
+        if temporario:
+            # Em POSIX o arquivo some do disco mas o mapeamento segue válido; no Windows um
+            # arquivo mapeado não pode ser removido e fica na pasta temporária
+            try:
+                os.remove(saida)
+            except PermissionError:
+                pass
+
+
+def _calcula_matriz(n, m, offsets, targets, reponderados, h, saida, processos):
+    """Roda os Dijkstra em paralelo, gravando em saida, e devolve a matriz mapeada."""
+    with open(saida, 'wb') as arquivo:
+        arquivo.truncate(8 * n * n)
+
+    blocos = [_compartilha(offsets, 'q'), _compartilha(targets, 'i'),
+              _compartilha(reponderados, 'd'), _compartilha(h, 'd')]
+    argumentos = (n, m, [bloco.name for bloco in blocos], saida)
+    try:
+        processos = processos or os.cpu_count() or 1
+        tamanho = max(1, n // (processos * 4))
+        intervalos = [(i, min(i + tamanho, n)) for i in range(0, n, tamanho)]
+        if processos == 1:
+            _inicializa_trabalhador(*argumentos)
+            try:
+                for inicio, fim in intervalos:
+                    _dijkstra_intervalo(inicio, fim)
+            finally:
+                _finaliza_trabalhador()
+        else:
+            with ProcessPoolExecutor(processos, initializer=_inicializa_trabalhador,
+                                     initargs=argumentos) as executor:
+                for tarefa in [executor.submit(_dijkstra_intervalo, i, f) for i, f in intervalos]:
+                    tarefa.result()
+    finally:
+        for bloco in blocos:
+            bloco.close()
+            bloco.unlink()
+
+    if n == 0:
+        # memoryview.cast não aceita dimensões nulas; o array ctypes já exporta shape (0, 0)
+        return memoryview((ctypes.c_double * 0 * 0)())
+    with open(saida, 'r+b') as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 8 * n * n)
+    return memoryview(mapa).cast('d', (n, n))
+
+
+if __name__ == "__main__":
+    # Mesmo grafo do Exemplo 1 do Bellman-Ford
+    vertices = [0, 1, 2, 3, 4]
+    arestas = [
+        (0, 1, -1),
+        (0, 2, 4),
+        (1, 2, 3),
+        (1, 3, 2),
+        (1, 4, 2),
+        (3, 2, 5),
+        (3, 1, 1),
+        (4, 3, -3),
+    ]
+    grafo = CSRGraph.from_edges(vertices, arestas)
+    matriz = johnson(grafo, processos=2)
+
+    print("Distâncias entre todos os pares:")
+    for i in range(grafo.num_vertices):
+        print(f"  {grafo.label_of(i)}: {[matriz[i, j] for j in range(grafo.num_vertices)]}")
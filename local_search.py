@@ -0,0 +1,247 @@
+"""
+    Nome da Tarefa: Busca local 2-opt / Or-opt para o Problema do Caixeiro Viajante
+
+    Descrição: Melhora um circuito já construído (por exemplo, pelo bellmore_neuhauser) com
+    movimentos 2-opt (troca de duas arestas invertendo o trecho entre elas) e Or-opt (move
+    um trecho de 1 a 3 cidades para outra aresta, em qualquer orientação). Cada cidade só
+    examina os seus k vizinhos mais próximos e cidades sem melhoria recente ficam de fora da
+    fila ("don't-look bits"), de modo que cada passada custa O(n·k). A busca tem orçamento de
+    tempo e de iterações e informa o custo a cada melhoria.
+"""
+
+import heapq
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy só acelera as listas de vizinhos de matrizes ndarray
+    np = None
+
+
+def neighbor_lists(cost_matrix, k):
+    """
+    Para cada cidade, as k cidades mais próximas em ordem crescente de custo.
+
+    Parâmetros:
+    cost_matrix : list[list[float]], numpy.ndarray ou coordinates.CoordinateCosts
+        Matriz de custos (quadrada e simétrica)
+    k : int
+        Número de vizinhos por cidade
+
+    Retorno:
+    list[list[int]]
+    """
+    n = len(cost_matrix)
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+
+    if hasattr(cost_matrix, 'nearest'):
+        # Custos sobre coordenadas (coordinates.CoordinateCosts): consulta à árvore k-d
+        return [cost_matrix.nearest(u, k) for u in range(n)]
+
+    if np is not None and isinstance(cost_matrix, np.ndarray):
+        costs = cost_matrix.astype(float)
+        np.fill_diagonal(costs, np.inf)
+        nearest = np.argpartition(costs, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(costs, nearest, axis=1).argsort(axis=1, kind='stable')
+        return np.take_along_axis(nearest, order, axis=1).tolist()
+
+    result = []
+    for u in range(n):
+        row = cost_matrix[u]
+        nearest = heapq.nsmallest(k + 1, range(n), key=row.__getitem__)
+        result.append([v for v in nearest if v != u][:k])
+    return result
+
+
+def improve_tour(cost_matrix, tour, neighbors=10, max_iterations=None, time_limit=None,
+                 on_improve=None):
+    """
+    Aplica 2-opt e Or-opt ao circuito até não haver melhoria ou acabar o orçamento.
+
+    Parâmetros:
+    cost_matrix : list[list[float]] ou numpy.ndarray
+        Matriz de custos (quadrada e simétrica)
+    tour : list[int]
+        Circuito inicial (cada cidade uma vez, sem repetir a primeira no fim)
+    neighbors : int
+        Quantos vizinhos mais próximos cada cidade examina
+    max_iterations : int
+        Número máximo de movimentos de melhoria (None = sem limite)
+    time_limit : float
+        Tempo máximo em segundos (None = sem limite); inclui montar as listas de vizinhos,
+        que não é interrompido
+    on_improve : callable
+        Chamada como on_improve(iteração, custo) após cada movimento aplicado
+
+    Retorno:
+    total_cost : float
+        Custo do circuito melhorado
+    tour : list[int]
+        Circuito melhorado, começando pela mesma cidade do circuito de entrada
+    """
+    n = len(tour)
+    tour = list(tour)
+    if n < 4:
+        return _tour_cost(cost_matrix, tour), tour
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    c = cost_matrix
+    first = tour[0]
+    pos = [0] * len(c)
+    for i, city in enumerate(tour):
+        pos[city] = i
+    near = neighbor_lists(cost_matrix, neighbors)
+
+    cost = _tour_cost(cost_matrix, tour)
+    eps = 1e-12 * max(1.0, abs(cost))  # Ignora "melhorias" que são só erro de arredondamento
+    iterations = 0
+
+    def reverse(i, j):
+        """Inverte o trecho cíclico tour[i..j] (posições), atualizando pos."""
+        for _ in range(((j - i) % n + 1) // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            pos[b], pos[a] = i, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    def two_opt(a):
+        """
+        Tenta trocar (a, succ a) e (v, succ v) por (a, v) e (succ a, succ v), com v entre os
+        vizinhos de a, e o mesmo com os predecessores. Devolve (delta, cidades tocadas) ou None.
+        """
+        for step in (1, -1):
+            an = tour[(pos[a] + step) % n]
+            d_a = c[a][an]
+            for v in near[a]:
+                g = d_a - c[a][v]
+                if g <= eps:
+                    break  # Vizinhos em ordem crescente: os próximos só pioram
+                vn = tour[(pos[v] + step) % n]
+                if v == an or vn == a:
+                    continue
+                delta = c[an][vn] - c[v][vn] - g
+                if delta < -eps:
+                    # Sentido direto: inverte an..v; sentido inverso: inverte v..an
+                    i, j = (pos[an], pos[v]) if step == 1 else (pos[v], pos[an])
+                    if (j - i) % n + 1 > n // 2:
+                        i, j = (j + 1) % n, (i - 1) % n  # Inverte o complemento, mais curto
+                    reverse(i, j)
+                    return delta, (a, an, v, vn)
+        return None
+
+    def or_opt(a):
+        """Tenta mover um trecho de 1 a 3 cidades que começa ou termina em a para perto de um
+        vizinho de a. Devolve (delta, cidades tocadas) ou None."""
+        for length in range(1, min(3, n - 3) + 1):
+            starts = (pos[a],) if length == 1 else (pos[a], (pos[a] - length + 1) % n)
+            for start in starts:
+                s1, s2 = tour[start], tour[(start + length - 1) % n]
+                p, nx = tour[start - 1], tour[(start + length) % n]
+                g = c[p][s1] + c[s2][nx] - c[p][nx]  # Ganho de retirar o trecho
+                if g <= eps:
+                    continue
+                inside = {tour[(start + k) % n] for k in range(length)}
+                for v in near[a]:
+                    if c[a][v] >= g:
+                        break
+                    if v in inside:
+                        continue
+                    for x in (v, tour[pos[v] - 1]):  # Arestas (v, succ v) e (pred v, v)
+                        if x == p or x in inside:
+                            continue
+                        y = tour[(pos[x] + 1) % n]
+                        keep = c[x][s1] + c[s2][y]
+                        flip = c[x][s2] + c[s1][y]
+                        delta = min(keep, flip) - c[x][y] - g
+                        if delta < -eps:
+                            move_segment(start, length, x, keep <= flip)
+                            return delta, (p, nx, s1, s2, x, y)
+        return None
+
+    def move_segment(start, length, x, forward):
+        """
+        Move o trecho A = tour[start..start+length-1] para entre x e y = succ x com até três
+        reversões, pelo lado mais curto: p A B y vira p B A y, ou x B' A nx vira x A B' nx.
+        forward indica se x fica ligado à primeira cidade de A.
+        """
+        end = (start + length - 1) % n
+        forward_gap = (pos[x] - end) % n        # |B| com B = succ(A)..x
+        backward_gap = (start - pos[x] - 1) % n  # |B'| com B' = succ(x)..pred(A)
+        if forward_gap <= backward_gap:
+            # p A B y -> p B A y: inverte AB, depois B e (se preciso) A
+            i, j = start, pos[x]
+            reverse(i, j)
+            reverse(i, (i + forward_gap - 1) % n)
+            if forward:
+                reverse((i + forward_gap) % n, j)
+        else:
+            # x B' A nx -> x A B' nx: inverte B'A, depois B' e (se preciso) A
+            i, j = (pos[x] + 1) % n, end
+            reverse(i, j)
+            reverse((i + length) % n, j)
+            if forward:
+                reverse(i, (i + length - 1) % n)
+
+    queue = deque(tour)
+    queued = bytearray(len(c))
+    for city in tour:
+        queued[city] = 1
+
+    while queue:
+        if max_iterations is not None and iterations >= max_iterations:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        a = queue.popleft()
+        queued[a] = 0
+
+        move = two_opt(a) or or_opt(a)
+        if move is None:
+            continue  # Sem melhoria: a fica de fora até um vizinho mudar
+
+        delta, touched = move
+        cost += delta
+        iterations += 1
+        for city in (a,) + touched:
+            if not queued[city]:
+                queued[city] = 1
+                queue.append(city)
+        if on_improve is not None:
+            on_improve(iterations, cost)
+
+    # Mantém a cidade inicial do circuito de entrada na primeira posição
+    k = pos[first]
+    tour = tour[k:] + tour[:k]
+    return _tour_cost(cost_matrix, tour), tour
+
+
+def _tour_cost(cost_matrix, tour):
+    """Custo do circuito fechado, somado na mesma ordem do bellmore_neuhauser."""
+    total_cost = 0
+    for i in range(len(tour)):
+        total_cost += cost_matrix[tour[i]][tour[(i + 1) % len(tour)]]
+    return total_cost
+
+
+if __name__ == "__main__":
+    from bellmore_e_neuhauser import bellmore_neuhauser
+
+    # 8 cidades em dois quadrados; custos euclidianos
+    pontos = [(0, 0), (0, 2), (2, 2), (2, 0), (5, 0), (5, 2), (7, 2), (7, 0)]
+    cost_matrix = [[((xa - xb) ** 2 + (ya - yb) ** 2) ** 0.5 for xb, yb in pontos]
+                   for xa, ya in pontos]
+
+    # Circuito com arestas cruzadas, melhorado passo a passo
+    cruzado = [0, 2, 1, 3, 6, 4, 5, 7]
+    total_cost, tour = improve_tour(
+        cost_matrix, cruzado, neighbors=4, max_iterations=100, time_limit=1.0,
+        on_improve=lambda iteracao, custo: print(f"  melhoria {iteracao}: {custo:.2f}"))
+    print(f"Após 2-opt/Or-opt: {total_cost:.2f} {tour}")
+
+    # Mesma busca como etapa final da heurística de Bellmore e Neuhauser
+    total_cost, tour = bellmore_neuhauser(cost_matrix, improve={'neighbors': 4})
+    print(f"Bellmore-Neuhauser + busca local: {total_cost:.2f} {tour}")
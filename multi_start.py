@@ -0,0 +1,158 @@
+"""
+    Nome da Tarefa: Bellmore e Neuhauser com vários pontos de partida em paralelo
+
+    Descrição: Roda a heurística de Bellmore e Neuhauser a partir de várias cidades iniciais,
+    distribuindo as partidas entre processos, e fica com o menor circuito. A matriz de custos
+    é copiada uma única vez para um bloco de memória compartilhada (int64 ou float64, por
+    linhas); cada processo a enxerga sem cópia, como uma lista de memoryviews por linha (ou
+    um ndarray no modo 'vetorizado'), e só os circuitos encontrados voltam pelo pickle.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from bellmore_e_neuhauser import bellmore_neuhauser
+
+try:
+    import numpy as np
+except ImportError:  # NumPy só é necessário para o modo 'vetorizado' e entradas ndarray
+    np = None
+
+# Estado de cada processo trabalhador (preenchido por _init_worker)
+_worker = {}
+
+
+def _share_matrix(cost_matrix):
+    """Copia a matriz para um bloco compartilhado; devolve (bloco, typecode)."""
+    n = len(cost_matrix)
+    if np is not None and isinstance(cost_matrix, np.ndarray):
+        kind = 'q' if np.issubdtype(cost_matrix.dtype, np.integer) else 'd'
+        data = np.ascontiguousarray(cost_matrix, dtype=np.int64 if kind == 'q' else np.float64)
+        block = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        block.buf[:data.nbytes] = data.tobytes()
+        return block, kind
+
+    # Inteiros ficam inteiros (custos idênticos aos da matriz original); senão float64
+    try:
+        rows = [array('q', row) for row in cost_matrix]
+        kind = 'q'
+    except TypeError:
+        rows = [array('d', row) for row in cost_matrix]
+        kind = 'd'
+    block = shared_memory.SharedMemory(create=True, size=max(1, 8 * n * n))
+    for i, row in enumerate(rows):
+        block.buf[8 * n * i:8 * n * (i + 1)] = row.tobytes()
+    return block, kind
+
+
+def _init_worker(name, n, kind, mode, improve):
+    """Anexa a matriz compartilhada uma única vez por processo."""
+    block = shared_memory.SharedMemory(name=name)
+    flat = block.buf[:8 * n * n].cast(kind)
+    if mode == 'vetorizado':
+        matrix = np.frombuffer(flat, dtype=np.int64 if kind == 'q' else np.float64).reshape(n, n)
+    else:
+        matrix = [flat[i * n:(i + 1) * n] for i in range(n)]
+    _worker.update(block=block, flat=flat, matrix=matrix, mode=mode, improve=improve)
+
+
+def _run_from(start):
+    """Constrói (e opcionalmente melhora) o circuito que parte da cidade start."""
+    w = _worker
+    total_cost, tour = bellmore_neuhauser(w['matrix'], w['mode'], w['improve'], start)
+    if hasattr(total_cost, 'item'):
+        total_cost = total_cost.item()  # Escalar do NumPy (modo 'vetorizado')
+    return total_cost, start, tour
+
+
+def _close_worker():
+    w = _worker
+    if isinstance(w.get('matrix'), list):
+        for row in w['matrix']:
+            row.release()
+    w.pop('matrix', None)  # Solta o ndarray antes de liberar o buffer
+    if w.get('flat') is not None:
+        w['flat'].release()
+    if w.get('block') is not None:
+        w['block'].close()
+    w.clear()
+
+
+def multi_start(cost_matrix, starts=None, processes=None, mode='incremental', improve=False):
+    """
+    Melhor circuito de Bellmore e Neuhauser entre várias cidades iniciais.
+
+    Parâmetros:
+    cost_matrix : list[list[float]] ou numpy.ndarray
+        Matriz de custos/distancias entre cidades (deve ser quadrada e simétrica)
+    starts : int ou iterable[int]
+        Cidades iniciais; um inteiro k escolhe k cidades igualmente espaçadas a partir da 0.
+        None usa uma partida por processo.
+    processes : int
+        Número de processos; None usa todos os núcleos, 1 roda no próprio processo
+    mode, improve :
+        Repassados ao bellmore_neuhauser (ver a sua documentação)
+
+    Retorno:
+    total_cost : float
+        Custo do melhor circuito (empates ficam com a menor cidade inicial)
+    tour : list[int]
+        Melhor circuito, começando pela sua cidade inicial
+    """
+    n = len(cost_matrix)
+    if n == 0:
+        return 0, []
+    if mode == 'vetorizado' and np is None:
+        raise ImportError("O modo 'vetorizado' requer o NumPy instalado.")
+
+    processes = processes or os.cpu_count() or 1
+    if starts is None:
+        starts = processes
+    if isinstance(starts, int):
+        k = max(1, min(starts, n))
+        starts = sorted({i * n // k for i in range(k)})
+    else:
+        starts = sorted(set(starts))
+        if not starts or not all(0 <= s < n for s in starts):
+            raise ValueError("As cidades iniciais devem estar entre 0 e n - 1.")
+
+    block, kind = _share_matrix(cost_matrix)
+    arguments = (block.name, n, kind, mode, improve)
+    try:
+        if processes == 1 or len(starts) == 1:
+            _init_worker(*arguments)
+            try:
+                results = [_run_from(s) for s in starts]
+            finally:
+                _close_worker()
+        else:
+            if isinstance(improve, dict) and improve.get('on_improve') is not None:
+                raise ValueError("on_improve só pode ser usado com processes=1.")
+            workers = min(processes, len(starts))
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=arguments) as executor:
+                results = list(executor.map(_run_from, starts))
+    finally:
+        block.close()
+        block.unlink()
+
+    total_cost, _, tour = min(results, key=lambda r: (r[0], r[1]))
+    return total_cost, tour
+
+
+if __name__ == "__main__":
+    import random
+
+    # 60 cidades aleatórias no quadrado unitário; custos euclidianos
+    random.seed(17)
+    pontos = [(random.random(), random.random()) for _ in range(60)]
+    cost_matrix = [[((xa - xb) ** 2 + (ya - yb) ** 2) ** 0.5 for xb, yb in pontos]
+                   for xa, ya in pontos]
+
+    custo_0, _ = bellmore_neuhauser(cost_matrix)
+    print(f"Partindo só da cidade 0: {custo_0:.4f}")
+
+    total_cost, tour = multi_start(cost_matrix, starts=12, processes=4)
+    print(f"Melhor de 12 partidas:   {total_cost:.4f} (circuito a partir da cidade {tour[0]})")
@@ -0,0 +1,179 @@
+"""
+    Nome da Tarefa: Componentes fortemente conexas, ordenação topológica e condensação
+
+    Descrição: Uma única DFS iterativa (algoritmo de Tarjan) sobre o índice ordenado do grafo
+    (o mesmo CSRGraph usado pelos DFS_Runner_List e DFS_Cycle_Finder) calcula as componentes
+    fortemente conexas em O(V + E), só com arrays por id. Cada componente é emitida quando a
+    sua raiz é finalizada, ou seja, na ordem dos tempos de finalização f da DFS; a ordem
+    inversa é uma ordem topológica do grafo de componentes. Num DAG cada vértice é a sua
+    própria componente e essa ordem coincide com a ordenação topológica do CLRS (vértices em
+    ordem decrescente de f). Aceita dicionários {vértice: [vizinhos]}, GraphAdjList e CSRGraph
+    (inclusive abertos de arquivo com csr_file.open_csr).
+"""
+
+from array import array
+
+from csr import CSRGraph, LabelView
+
+
+def scc_arrays(graph):
+    """
+    Componentes fortemente conexas por id.
+
+    Retorno:
+    index : CSRGraph
+        Índice ordenado cujos ids indexam component
+    component : array('i')
+        Componente de cada vértice, numeradas em ordem topológica (nenhuma aresta vai de uma
+        componente para outra de número menor)
+    count : int
+        Número de componentes
+    """
+    index = CSRGraph.from_graph(graph).ordered()
+    n = index.num_vertices
+    offsets, targets = index.offsets, index.targets
+    disc = array('i', [-1]) * n
+    low = array('i', bytes(4 * n))
+    cursor = array('q', bytes(8 * n))
+    component = array('i', [-1]) * n  # Visitado e ainda sem componente = está na pilha
+    stack = []  # Pilha de Tarjan
+    timer = count = 0
+
+    for r in range(n):
+        if disc[r] >= 0:
+            continue
+        disc[r] = low[r] = timer
+        timer += 1
+        cursor[r] = offsets[r]
+        stack.append(r)
+        path = [r]  # Pilha de chamadas da DFS
+        while path:
+            u = path[-1]
+            k = cursor[u]
+            if k < offsets[u + 1]:
+                cursor[u] = k + 1
+                v = targets[k]
+                if disc[v] < 0:
+                    disc[v] = low[v] = timer
+                    timer += 1
+                    cursor[v] = offsets[v]
+                    stack.append(v)
+                    path.append(v)
+                elif component[v] < 0 and disc[v] < low[u]:
+                    low[u] = disc[v]
+                continue
+
+            # u finalizado
+            path.pop()
+            if path and low[u] < low[path[-1]]:
+                low[path[-1]] = low[u]
+            if low[u] == disc[u]:
+                while True:
+                    x = stack.pop()
+                    component[x] = count
+                    if x == u:
+                        break
+                count += 1
+
+    # Componentes saíram em ordem de finalização (sorvedouros primeiro): inverte a numeração
+    last = count - 1
+    for v in range(n):
+        component[v] = last - component[v]
+    return index, component, count
+
+
+def strongly_connected_components(graph):
+    """Lista das componentes fortemente conexas (listas de rótulos), em ordem topológica."""
+    index, component, count = scc_arrays(graph)
+    members = [[] for _ in range(count)]
+    for v in range(index.num_vertices):
+        members[component[v]].append(index.label_of(v))
+    return members
+
+
+def topological_sort(graph):
+    """
+    Ordenação topológica de um grafo direcionado acíclico (vértices em ordem decrescente
+    do tempo de finalização da DFS). Lança ValueError se o grafo tiver ciclo.
+    """
+    index, component, count = scc_arrays(graph)
+    n = index.num_vertices
+    offsets, targets = index.offsets, index.targets
+    if count < n:
+        raise ValueError("O grafo contém ciclo: não há ordenação topológica.")
+    for u in range(n):
+        if u in targets[offsets[u]:offsets[u + 1]]:
+            raise ValueError(f"O grafo contém ciclo (laço em '{index.label_of(u)}'): "
+                             "não há ordenação topológica.")
+    order = array('i', bytes(4 * n))
+    for v in range(n):
+        order[component[v]] = v
+    return [index.label_of(v) for v in order]
+
+
+def condensation(graph):
+    """
+    Grafo de componentes: um vértice por componente fortemente conexa (ids 0..k-1, em ordem
+    topológica) e uma aresta c -> d, sem repetições, se alguma aresta do grafo liga as duas.
+
+    Retorno:
+    dag : CSRGraph
+        Condensação (direcionada e acíclica), com cada linha em ordem crescente
+    component : LabelView
+        Visão {rótulo: componente} sobre o array de componentes (em .data)
+    """
+    index, component, count = scc_arrays(graph)
+    n = index.num_vertices
+    offsets, targets = index.offsets, index.targets
+
+    # Vértices agrupados por componente (ordenação por contagem)
+    start = array('q', bytes(8 * (count + 1)))
+    for v in range(n):
+        start[component[v] + 1] += 1
+    for c in range(count):
+        start[c + 1] += start[c]
+    members = array('i', bytes(4 * n))
+    pos = array('q', start)
+    for v in range(n):
+        c = component[v]
+        members[pos[c]] = v
+        pos[c] += 1
+
+    dag_offsets = array('q', [0])
+    dag_targets = array('i')
+    mark = array('i', [-1]) * count  # Última componente que já ganhou a aresta para d
+    for c in range(count):
+        row = []
+        for u in members[start[c]:start[c + 1]]:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                d = component[v]
+                if d != c and mark[d] != c:
+                    mark[d] = c
+                    row.append(d)
+        row.sort()
+        dag_targets.extend(row)
+        dag_offsets.append(len(dag_targets))
+
+    dag = CSRGraph(dag_offsets, dag_targets, None, None, directed=True)
+    return dag, LabelView(index, component, missing=-1)
+
+
+if __name__ == "__main__":
+    # Mesmo grafo do DFS: A, B, C e D formam um ciclo; E -> F -> G não tem ciclo
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['D'],
+        'C': ['D'],
+        'D': ['A'],
+        'E': ['F', 'G'],
+        'F': ['G'],
+        'G': [],
+        'H': []
+    }
+    print("Componentes (ordem topológica):", strongly_connected_components(grafo))
+    dag, componente = condensation(grafo)
+    print("Condensação:", dag, list(dag.edges()), "- componente de D:", componente['D'])
+
+    tarefas = {'compilar': ['testar'], 'testar': ['publicar'], 'documentar': ['publicar'],
+               'publicar': []}
+    print("Ordem das tarefas:", topological_sort(tarefas))
@@ -0,0 +1,128 @@
+"""
+    Nome da Tarefa: Visualização de grafos
+
+    Descrição: Camada de desenho usada por GraphMatrix.visualize e GraphList.visualize
+    (graph.py). O matplotlib e o networkx só são importados quando um desenho é pedido, de
+    modo que importar graph.py não carrega nenhum dos dois. Com path, a figura é gerada sem
+    interface gráfica (canvas Agg próprio da figura, sem pyplot e sem trocar o backend) e
+    gravada em PNG, SVG ou outro formato reconhecido pela extensão. Grafos maiores que
+    max_nodes são reduzidos antes do layout: por amostragem de vértices (subgrafo induzido)
+    ou por agregação de vértices em grupos.
+"""
+
+import random
+
+
+def draw_graph(num_vertices, neighbors, title, layout='spring', node_color='#7bed9f',
+               edge_color='#ff6b81', path=None, max_nodes=300, large_mode='sample', seed=42,
+               isolated=True, label_limit=None):
+    """
+    Desenha um grafo não direcionado. Laços (v, v) não são desenhados.
+
+    Parâmetros:
+    num_vertices : int
+        Número de vértices (ids 0..num_vertices - 1)
+    neighbors : callable
+        neighbors(v) devolve os vizinhos do vértice v
+    title : str
+        Título da figura
+    layout : str
+        'spring' ou 'circular'
+    path : str
+        Arquivo de saída (.png, .svg, ...); None abre a janela do matplotlib (plt.show)
+    max_nodes : int
+        Acima deste número de vértices o grafo é reduzido antes do desenho
+    large_mode : str
+        'sample' desenha o subgrafo induzido por max_nodes vértices sorteados; 'aggregate'
+        junta vértices de ids consecutivos em max_nodes grupos (tamanho do nó ~ vértices do
+        grupo, espessura da aresta ~ arestas entre os grupos)
+    seed : int
+        Semente da amostragem e do layout 'spring'
+    isolated : bool
+        Se falso, vértices sem arestas desenhadas ficam fora da figura
+    label_limit : int
+        Se dado, os rótulos dos nós só são escritos em figuras com até label_limit nós;
+        None (padrão) escreve sempre
+    """
+    import networkx as nx
+
+    G = nx.Graph()
+    sizes, widths = 800, 2
+    if num_vertices <= max_nodes:
+        if isolated:
+            G.add_nodes_from(range(num_vertices))
+        for v in range(num_vertices):
+            G.add_edges_from((v, w) for w in neighbors(v) if w > v)
+    elif large_mode == 'sample':
+        chosen = sorted(random.Random(seed).sample(range(num_vertices), max_nodes))
+        members = set(chosen)
+        if isolated:
+            G.add_nodes_from(chosen)
+        for v in chosen:
+            G.add_edges_from((v, w) for w in neighbors(v) if w > v and w in members)
+        sizes = 300
+        title += f" (amostra de {max_nodes} de {num_vertices} vértices)"
+    elif large_mode == 'aggregate':
+        # Grupo de v: ids consecutivos, max_nodes grupos de tamanhos quase iguais
+        group = [v * max_nodes // num_vertices for v in range(num_vertices)]
+        G.add_nodes_from(range(max_nodes), size=0)
+        for v in range(num_vertices):
+            g = group[v]
+            G.nodes[g]['size'] += 1
+            for w in neighbors(v):
+                if w > v and group[w] != g:
+                    h = group[w]
+                    if G.has_edge(g, h):
+                        G[g][h]['weight'] += 1
+                    else:
+                        G.add_edge(g, h, weight=1)
+        largest_group = max(size for _, size in G.nodes(data='size'))
+        largest_edge = max((w for _, _, w in G.edges(data='weight')), default=1)
+        sizes = [300 * size / largest_group + 20 for _, size in G.nodes(data='size')]
+        widths = [0.5 + 3 * w / largest_edge for _, _, w in G.edges(data='weight')]
+        title += f" ({num_vertices} vértices em {max_nodes} grupos)"
+    else:
+        raise ValueError(f"Modo desconhecido: {large_mode!r} (use 'sample' ou 'aggregate').")
+
+    pos = nx.circular_layout(G) if layout == 'circular' else nx.spring_layout(G, seed=seed)
+    labels = label_limit is None or G.number_of_nodes() <= label_limit
+    options = dict(with_labels=labels, node_size=sizes, node_color=node_color,
+                   edge_color=edge_color, width=widths, font_weight='bold')
+
+    if path is None:
+        import matplotlib.pyplot as plt
+
+        plt.figure(figsize=(7, 6))
+        plt.title(title, fontsize=14)
+        nx.draw(G, pos, **options)
+        plt.show()
+        return
+
+    # Canvas Agg próprio da figura: grava o arquivo sem interface gráfica e sem mexer no
+    # backend global do matplotlib, então visualize() sem path continua abrindo a janela.
+    # Nós, arestas e rótulos desenhados direto no ax: nx.draw e nx.draw_networkx chamam
+    # plt.draw_if_interactive, que carregaria um backend
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(7, 6), facecolor='w')
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.set_title(title, fontsize=14)
+    nx.draw_networkx_nodes(G, pos, ax=ax, node_size=sizes, node_color=node_color)
+    nx.draw_networkx_edges(G, pos, ax=ax, edge_color=edge_color, width=widths)
+    if labels:
+        nx.draw_networkx_labels(G, pos, ax=ax, font_weight='bold')
+    ax.set_axis_off()
+    fig.savefig(path)
+
+
+if __name__ == "__main__":
+    # Ciclo de 2000 vértices com cordas: amostrado e agregado, gravado em arquivos
+    n = 2000
+    adjacencia = [[(v - 1) % n, (v + 1) % n, (v + 7) % n, (v - 7) % n] for v in range(n)]
+    draw_graph(n, adjacencia.__getitem__, "Ciclo com cordas", path="amostra.png",
+               label_limit=50)
+    draw_graph(n, adjacencia.__getitem__, "Ciclo com cordas", path="agregado.svg",
+               max_nodes=40, large_mode='aggregate', layout='circular')
+    print("Figuras gravadas em amostra.png e agregado.svg")